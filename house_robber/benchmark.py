@@ -0,0 +1,185 @@
+"""Benchmark card building, scene construction and rendering.
+
+    python benchmark.py                                  # writes bench_results.json
+    python benchmark.py --baseline baseline.json         # compare against a stored run
+
+Every size gets a deterministic pseudo-random house array. The low quality
+render also records a SHA-256 of every frame sent to the movie, so a speedup
+can be checked against a baseline for identical output. The memory run checks
+that the traced heap of a long example stays flat as the input grows.
+"""
+import argparse
+import hashlib
+import json
+import platform
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from manim import __version__ as manim_version
+from manim import tempconfig
+from manim.renderer.cairo_renderer import CairoRenderer
+
+from scene import CARD_CACHE, GLYPH_CACHE, ICON_CACHE, SVG_CACHE, TEXT_CACHE, HouseRobber, example_scene
+
+
+def sample_houses(size, seed=198):
+    rng = random.Random(seed + size)
+    return [rng.randint(0, 99) for _ in range(size)]
+
+
+def clear_caches():
+    for cache in (SVG_CACHE, ICON_CACHE, CARD_CACHE, GLYPH_CACHE, TEXT_CACHE):
+        cache.clear()
+
+
+def bench_builders(size):
+    """Cards built per second, starting from cold caches, for a row of ``size`` houses."""
+    houses = sample_houses(size)
+    scene = HouseRobber()
+    builders = {
+        "create_house_box": lambda v: scene.create_house_box(v, 0.9),
+        "create_person_box": lambda v: scene.create_person_box("r1", str(v), 0.9),
+        "create_loot_box": lambda v: scene.create_loot_box("t", str(v), 0.9),
+        "create_text_box": lambda v: scene.create_text_box(f"House {v}: Rob it (+{v}) or skip?", 4.5, 0.9),
+    }
+    results = {}
+    for name, build in builders.items():
+        clear_caches()
+        start = time.perf_counter()
+        for value in houses:
+            build(value)
+        seconds = time.perf_counter() - start
+        results[name] = {"seconds": round(seconds, 4), "per_second": round(size / seconds, 1)}
+    return results
+
+
+def bench_construct(size):
+    """construct() with rendering disabled: just mobjects, plans and the DP."""
+    clear_caches()
+    with tempconfig({"write_to_movie": False, "disable_caching": True, "verbosity": "WARNING"}):
+        scene = example_scene(sample_houses(size))(skip_animations=True)
+        start = time.perf_counter()
+        scene.render()
+        return {"seconds": round(time.perf_counter() - start, 4)}
+
+
+def bench_memory(size):
+    """Peak traced Python heap of construct() with rendering disabled."""
+    clear_caches()
+    with tempconfig({"write_to_movie": False, "disable_caching": True, "verbosity": "WARNING"}):
+        scene = example_scene(sample_houses(size))(skip_animations=True)
+        tracemalloc.start()
+        try:
+            scene.render()
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    return {"peak_mb": round(peak / 2**20, 1)}
+
+
+class ChecksumRenderer(CairoRenderer):
+    """Hashes every frame as it goes to the movie writer.
+
+    Hashing what is written, rather than redrawing after each play, covers
+    frames in the middle of a play and doesn't depend on how a play was
+    split into a static background and moving mobjects.
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.frame_hashes = []
+
+    def add_frame(self, frame, num_frames=1):
+        if not self.skip_animations:
+            self.frame_hashes += [hashlib.sha256(frame.tobytes()).hexdigest()] * num_frames
+        super().add_frame(frame, num_frames)
+
+
+def bench_render(size):
+    """Low quality end-to-end render, with golden frame checksums."""
+    clear_caches()
+    with tempfile.TemporaryDirectory() as media_dir, tempconfig({
+        "quality": "low_quality",
+        "media_dir": media_dir,
+        "disable_caching": True,
+        "verbosity": "WARNING",
+    }):
+        scene = example_scene(sample_houses(size))(renderer=ChecksumRenderer())
+        start = time.perf_counter()
+        scene.render()
+        seconds = time.perf_counter() - start
+
+    frame_hashes = scene.renderer.frame_hashes
+    checksum = hashlib.sha256("".join(frame_hashes).encode()).hexdigest()
+    return {"seconds": round(seconds, 4), "frames": len(frame_hashes), "checksum": checksum,
+            "frame_checksums": frame_hashes}
+
+
+def compare(results, baseline):
+    """Print timing ratios against the baseline; return False if any checksum differs."""
+    identical = True
+    for bench in ("builders", "construct", "render"):
+        for size, current in results[bench].items():
+            old = baseline.get(bench, {}).get(size)
+            if old is None:
+                continue
+            rows = current.items() if bench == "builders" else [(bench, current)]
+            old_rows = old if bench == "builders" else {bench: old}
+            for name, row in rows:
+                if name in old_rows:
+                    ratio = old_rows[name]["seconds"] / row["seconds"] if row["seconds"] else float("inf")
+                    print(f"{bench:<10} {size:>6} {name:<18} {row['seconds']:9.3f}s  {ratio:5.2f}x baseline")
+            if bench == "render" and old.get("checksum") != current["checksum"]:
+                identical = False
+                print(f"render     {size:>6} frame checksums differ from baseline")
+    return identical
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="4,10,100,1000", help="house counts for builders and construct")
+    parser.add_argument("--render-sizes", default="4,10",
+                        help="house counts to render end to end (1.2s of video per house)")
+    parser.add_argument("--memory-sizes", default="10,10000", help="house counts for the traced heap peak")
+    parser.add_argument("-o", "--output", default="bench_results.json")
+    parser.add_argument("--baseline", help="results file to compare against")
+    args = parser.parse_args()
+
+    sizes = [int(n) for n in args.sizes.split(",") if n]
+    render_sizes = [int(n) for n in args.render_sizes.split(",") if n]
+    memory_sizes = [int(n) for n in args.memory_sizes.split(",") if n]
+
+    results = {
+        "meta": {"python": platform.python_version(), "platform": platform.platform(), "manim": manim_version},
+        "builders": {},
+        "construct": {},
+        "render": {},
+        "memory": {},
+    }
+    for size in sizes:
+        results["builders"][str(size)] = bench_builders(size)
+        results["construct"][str(size)] = bench_construct(size)
+        print(f"{size:>6} houses: construct {results['construct'][str(size)]['seconds']:.3f}s")
+    for size in render_sizes:
+        results["render"][str(size)] = bench_render(size)
+        print(f"{size:>6} houses: render    {results['render'][str(size)]['seconds']:.3f}s")
+    for size in memory_sizes:
+        results["memory"][str(size)] = bench_memory(size)
+        print(f"{size:>6} houses: heap peak {results['memory'][str(size)]['peak_mb']:.1f} MB")
+
+    with open(args.output, "w") as f:
+        json.dump(results, f, indent=2)
+    print(f"Results written to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        if not compare(results, baseline):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
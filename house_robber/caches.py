@@ -0,0 +1,159 @@
+"""In-process caches for mobjects that are expensive to build."""
+import time
+from collections import OrderedDict
+
+from manim import NORMAL, RIGHT, Text, VGroup
+
+DIGITS = "0123456789"
+# Characters a monospaced glyph set covers; proportional fonts only get digits,
+# which are tabular (equal advance) in the faces this project uses.
+MONO_CHARSET = DIGITS + "+-=>≥$!SKIP"
+# How far, as a fraction of the advance, a glyph's centre may sit from its cell's
+GLYPH_TOLERANCE = 0.25
+
+
+class MobjectCache:
+    """Bounded LRU cache of built mobjects that hands out copies.
+
+    Mobjects are mutable, so callers always get a copy and the cached
+    original never ends up in a scene.
+    """
+
+    def __init__(self, name, maxsize=128):
+        self.name = name
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.build_time = 0.0
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key, build):
+        """Return a copy of the mobject for ``key``, calling ``build()`` on a miss."""
+        mob = self._entries.get(key)
+        if mob is None:
+            self.misses += 1
+            start = time.perf_counter()
+            mob = build()
+            self.build_time += time.perf_counter() - start
+            self._entries[key] = mob
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        else:
+            self.hits += 1
+            self._entries.move_to_end(key)
+        return mob.copy()
+
+    def clear(self):
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+        self.build_time = 0.0
+
+    def stats(self):
+        """Hit/miss counts and an estimate of the build time saved by hits."""
+        avg_build = self.build_time / self.misses if self.misses else 0.0
+        return {
+            "name": self.name,
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "build_seconds": round(self.build_time, 4),
+            "saved_seconds": round(self.hits * avg_build, 4),
+        }
+
+    def summary(self):
+        s = self.stats()
+        return (
+            f"{s['name']} cache: {s['hits']} hits, {s['misses']} misses, "
+            f"{s['size']}/{s['maxsize']} entries, ~{s['saved_seconds']:.2f}s saved"
+        )
+
+
+class GlyphCache:
+    """Assemble short strings from cached per-character glyphs.
+
+    Each (font, font_size, color, slant) renders its whole charset in one
+    Pango call. Strings are then built from copies of those glyphs placed on
+    a fixed advance, so anything outside the charset (or a string with a
+    newline) falls back to a plain ``Text``.
+    """
+
+    def __init__(self, mono_fonts=(), maxsize=32):
+        self.mono_fonts = set(mono_fonts)
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.fallbacks = 0
+        self._sets = OrderedDict()
+
+    def _glyph_set(self, font, font_size, color, slant):
+        key = (font, font_size, color, slant)
+        if key in self._sets:
+            self._sets.move_to_end(key)
+            return self._sets[key]
+
+        self.misses += 1
+        charset = MONO_CHARSET if font in self.mono_fonts else DIGITS
+        reference = Text(charset, font=font, font_size=font_size, color=color, slant=slant)
+        glyph_set = None
+        # Pango merging or splitting something (ligatures) changes the count; don't guess
+        if len(reference.submobjects) == len(charset):
+            offsets = [glyph.get_center()[0] for glyph in reference]
+            first_x = offsets[0]
+            advance = (offsets[9] - first_x) / 9
+            # Glyphs can only be placed on a fixed advance if the face is
+            # monospaced; a missing font (Menlo off macOS) falls back to one that isn't
+            if advance > 0 and all(
+                abs(x - first_x - i * advance) <= GLYPH_TOLERANCE * advance for i, x in enumerate(offsets)
+            ):
+                glyphs = {}
+                for i, (char, glyph) in enumerate(zip(charset, reference)):
+                    # Put every glyph's cell at x=0, keeping the shared baseline
+                    glyphs[char] = glyph.copy().shift(RIGHT * -(first_x + i * advance))
+                glyph_set = (glyphs, advance)
+
+        self._sets[key] = glyph_set
+        if len(self._sets) > self.maxsize:
+            self._sets.popitem(last=False)
+        return glyph_set
+
+    def text(self, string, font, font_size, color, slant=NORMAL):
+        """Return ``string`` as a VGroup of glyph copies, or a ``Text`` fallback."""
+        glyph_set = self._glyph_set(font, font_size, color, slant)
+        if glyph_set is not None:
+            glyphs, advance = glyph_set
+            if string.strip() and all(c == " " or c in glyphs for c in string):
+                self.hits += 1
+                return VGroup(*[
+                    glyphs[c].copy().shift(RIGHT * i * advance)
+                    for i, c in enumerate(string) if c != " "
+                ])
+
+        self.fallbacks += 1
+        return Text(string, font=font, font_size=font_size, color=color, slant=slant)
+
+    def clear(self):
+        self._sets.clear()
+        self.hits = 0
+        self.misses = 0
+        self.fallbacks = 0
+
+    def stats(self):
+        return {
+            "name": "glyph",
+            "hits": self.hits,
+            "misses": self.misses,
+            "fallbacks": self.fallbacks,
+            "size": len(self._sets),
+            "maxsize": self.maxsize,
+        }
+
+    def summary(self):
+        return (
+            f"glyph cache: {self.hits} strings assembled, {self.misses} glyph sets rendered, "
+            f"{self.fallbacks} Text fallbacks"
+        )
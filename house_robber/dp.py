@@ -0,0 +1,57 @@
+"""The House Robber DP on its own, separate from any animation.
+
+The scene consumes ``dp_trace`` one step at a time, paced by the number of
+houses, so the trace is never held as a whole. A job can be validated and
+its loop paced without importing manim or building a single mobject.
+"""
+from collections import namedtuple
+
+# One iteration of the O(1)-space DP: r1/r2 going in, the new best t, and
+# whether robbing this house (r1 + value >= r2) is what produced it
+DPStep = namedtuple("DPStep", "index value r1 r2 t is_rob")
+
+
+def validate_houses(houses):
+    """Raise ValueError unless ``houses`` is a list of non-negative ints."""
+    for i, value in enumerate(houses):
+        if isinstance(value, bool) or not isinstance(value, int):
+            raise ValueError(f"house {i} must be an int, got {value!r}")
+        if value < 0:
+            raise ValueError(f"house {i} must be non-negative, got {value}")
+
+
+def dp_trace(houses):
+    """Yield a DPStep for each house, holding only r1 and r2 in memory."""
+    r1, r2 = 0, 0
+    for i, value in enumerate(houses):
+        r1_plus_val = r1 + value
+        t = max(r1_plus_val, r2)
+        yield DPStep(i, value, r1, r2, t, r1_plus_val >= r2)
+        r1, r2 = r2, t
+
+
+def pace(n, budget, step_seconds, sweep_seconds, edge=3):
+    """Split ``n`` loop iterations into detailed steps and batched sweeps.
+
+    Returns (start, stop, detailed) ranges in order. Without a ``budget``
+    or when every step fits in it, each iteration is detailed. Otherwise the
+    first and last ``edge`` iterations stay detailed, fewer if even those
+    don't fit but never none, and the middle is cut into as many equal
+    sweeps as the rest of the budget allows.
+    """
+    if budget is None or n * step_seconds <= budget:
+        return [(i, i + 1, True) for i in range(n)]
+    edge = max(1, min(edge, n // 2))
+    while edge > 1 and 2 * edge * step_seconds + sweep_seconds > budget:
+        edge -= 1
+    middle = n - 2 * edge
+    if middle <= 0:
+        # One or two iterations: nothing to batch, so show them even over budget
+        return [(i, i + 1, True) for i in range(n)]
+    sweeps = max(1, min(middle, int((budget - 2 * edge * step_seconds) // sweep_seconds)))
+    size = -(-middle // sweeps)
+    return (
+        [(i, i + 1, True) for i in range(edge)]
+        + [(start, min(start + size, n - edge), False) for start in range(edge, n - edge, size)]
+        + [(i, i + 1, True) for i in range(n - edge, n)]
+    )
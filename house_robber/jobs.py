@@ -0,0 +1,83 @@
+"""Render single-example HouseRobber jobs in a long-lived worker process.
+
+A job is a dict:
+
+    {"houses": [2, 7, 9, 3, 1], "mode": "fast", "box_size": 0.9,
+     "box_buff": 0.12, "budget": 60, "quality": "l", "output": "out/job1.mp4"}
+
+Only ``houses`` and ``output`` are required, and an ``id`` is copied to the
+result. Workers call ``warm_up`` once, so manim, the fonts, the icon SVGs and
+the glyph sets are loaded before the first job and stay loaded for every job
+after it.
+"""
+import os
+import shutil
+import tempfile
+import time
+
+from manim import Text, tempconfig
+
+from dp import validate_houses
+from render_sections import QUALITIES
+from scene import FONT_MONO, HouseRobber, example_scene
+
+JOB_DEFAULTS = {
+    "mode": "fast", "box_size": 0.9, "box_buff": 0.12, "budget": None, "quality": "m", "title_text": "Example",
+}
+
+
+def warm_up():
+    """Pool initializer: parse the icons and lay out both fonts once."""
+    scene = HouseRobber()
+    for size in (0.9, 1.1):
+        scene.create_house_box(0, size)
+        scene.create_person_box("r1", "0", size)
+        scene.create_loot_box("t", "0", size)
+    scene.create_text_box("House 1: Rob it?", 4.5, 0.9)
+    # Pango font discovery for the code listing's font
+    Text("0", font=FONT_MONO)
+
+
+def job_settings(job):
+    """Fill in defaults and check a job before any rendering starts."""
+    if not isinstance(job, dict):
+        raise ValueError(f"a job must be a dict, got {type(job).__name__}")
+    if "houses" not in job or "output" not in job:
+        raise ValueError("a job needs 'houses' and 'output'")
+    settings = dict(JOB_DEFAULTS, **job)
+    validate_houses(settings["houses"])
+    if settings["mode"] not in ("slow", "fast"):
+        raise ValueError(f"mode must be 'slow' or 'fast', got {settings['mode']!r}")
+    if settings["quality"] not in QUALITIES:
+        raise ValueError(f"quality must be one of {', '.join(QUALITIES)}, got {settings['quality']!r}")
+    return settings
+
+
+def render_job(job):
+    """Render one job to its output path; returns a result dict, never raises."""
+    start = time.perf_counter()
+    try:
+        settings = job_settings(job)
+        scene_cls = example_scene(
+            settings["houses"], mode=settings["mode"], box_size=settings["box_size"],
+            box_buff=settings["box_buff"], title_text=settings["title_text"], budget=settings["budget"],
+        )
+        output = os.path.abspath(settings["output"])
+        os.makedirs(os.path.dirname(output), exist_ok=True)
+        with tempfile.TemporaryDirectory(dir=os.path.dirname(output)) as media_dir, tempconfig({
+            "quality": QUALITIES[settings["quality"]],
+            "media_dir": media_dir,
+            # Elided holds need every play rendered, not taken from manim's cache
+            "disable_caching": scene_cls.elide_holds,
+            "verbosity": "WARNING",
+        }):
+            scene = scene_cls()
+            scene.render()
+            shutil.move(str(scene.renderer.file_writer.movie_file_path), output)
+    except Exception as error:
+        known = job if isinstance(job, dict) else {}
+        return {"id": known.get("id"), "output": known.get("output"), "ok": False,
+                "error": f"{type(error).__name__}: {error}",
+                "seconds": round(time.perf_counter() - start, 3), "pid": os.getpid()}
+    return {"id": job.get("id"), "output": output, "ok": True,
+            "seconds": round(time.perf_counter() - start, 3), "pid": os.getpid()}
@@ -0,0 +1,107 @@
+"""Split a play's mobjects into a cached background layer and a moving layer.
+
+Manim draws every mobject that isn't moving into a static image once per
+play, then redraws the rest on top of it for every frame. It decides what
+counts as moving by draw order: everything after the first animated mobject
+is redrawn, so one animated house at the start of the row makes the whole
+scene move.
+
+``split_layers`` uses what each animation touches instead. Untouched
+mobjects go into the background, even when drawn after an animated one,
+unless they overlap the area the animations may cover. Those have to be
+redrawn above the moving layer to keep the draw order, and the frames stay
+the same as without layering.
+"""
+import numpy as np
+from manim.utils.family import extract_mobject_family_members
+from manim.utils.iterables import list_update
+
+
+def leaf_animations(animations):
+    """The animations inside groups and successions, flattened."""
+    for anim in animations:
+        parts = getattr(anim, "animations", None)
+        if parts is None:
+            yield anim
+        else:
+            yield from leaf_animations(parts)
+
+
+def bounds(mobjects):
+    """(xmin, ymin, xmax, ymax) of the points of ``mobjects``, or None without points."""
+    points = [mob.points for mob in mobjects if len(mob.points)]
+    if not points:
+        return None
+    points = np.concatenate(points)[:, :2]
+    return np.concatenate([points.min(axis=0), points.max(axis=0)])
+
+
+def sweep(anim):
+    """Rectangles covering where an animation's mobject may be drawn.
+
+    Includes the mobject where it is now, a Transform target or ``.animate``
+    target if one is known, and the offset a FadeIn/FadeOut shift or scale
+    adds. A DeferredTransform's target is built later, so it is assumed to
+    cover the mobject's own area, which is how the scene uses it.
+    """
+    rect = bounds(anim.mobject.family_members_with_points())
+    if rect is None:
+        return []
+    rects = [rect]
+    for target in (getattr(anim, "target_mobject", None), getattr(anim.mobject, "target", None)):
+        if target is not None:
+            target_rect = bounds(target.family_members_with_points())
+            if target_rect is not None:
+                rects.append(target_rect)
+    shift = getattr(anim, "shift_vector", None)
+    if shift is not None:
+        offset = np.tile(np.asarray(shift)[:2], 2)
+        rects += [rect + offset, rect - offset]
+    scale = getattr(anim, "scale_factor", 1)
+    if scale > 1:
+        grow = (rect[2:] - rect[:2]) * (scale - 1) / 2
+        rects.append(rect + np.concatenate([-grow, grow]))
+    return rects
+
+
+def split_layers(scene, animations, margin=0.1):
+    """(moving, static) family members for ``animations``, both in draw order.
+
+    Returns None when this can't be decided up front, because some mobject
+    has updaters or is in the foreground. The caller then falls back to
+    manim's own split.
+    """
+    if scene.foreground_mobjects or any(mob.updaters for mob in scene.get_mobject_family_members()):
+        return None
+
+    # Groups without points stay in: a group that gains submobjects mid-play
+    # (see HouseRow.lift) is redrawn with them as long as it is in the moving layer
+    drawn = extract_mobject_family_members(
+        list_update(scene.mobjects, scene.foreground_mobjects),
+        use_z_index=scene.renderer.camera.use_z_index,
+    )
+    leaves = list(leaf_animations(animations))
+    touched = {id(mob) for anim in leaves for mob in anim.mobject.get_family()}
+    first = next((i for i, mob in enumerate(drawn) if id(mob) in touched), None)
+    if first is None:
+        return [], [mob for mob in drawn if len(mob.points)]
+
+    rects = [rect for anim in leaves for rect in sweep(anim)]
+    # Pad by the margin to cover stroke widths
+    rects = np.array(rects) + np.array([-margin, -margin, margin, margin]) if rects else np.empty((0, 4))
+    moving, static = [], []
+    for i, mob in enumerate(drawn):
+        if id(mob) in touched:
+            moving.append(mob)
+            continue
+        rect = bounds([mob])
+        if rect is None:
+            # An untouched group draws nothing itself, and its family is already listed
+            continue
+        if i > first:
+            overlaps = (rect[:2] <= rects[:, 2:]).all(axis=1) & (rect[2:] >= rects[:, :2]).all(axis=1)
+            if overlaps.any():
+                moving.append(mob)
+                continue
+        static.append(mob)
+    return moving, static
@@ -0,0 +1,145 @@
+"""Animations that can be queued ahead of time, and a plan that batches them
+into as few ``Scene.play`` calls as its waits allow."""
+from manim import Animation, AnimationGroup, ManimColor, Succession, Transform, Wait, interpolate_color
+
+from layers import leaf_animations
+
+
+class Reveal(Animation):
+    """Fade a mobject in from transparent without touching its points.
+
+    Unlike ``FadeIn`` this isn't an introducer: the mobject is hidden as
+    soon as the animation is created and must already be in the scene,
+    which lets the fade start part-way through a ``Succession``.
+    """
+
+    def __init__(self, mobject, **kwargs):
+        self.opacities = [
+            (mob, mob.get_fill_opacity(), mob.get_stroke_opacity())
+            for mob in mobject.family_members_with_points()
+        ]
+        super().__init__(mobject, **kwargs)
+        self.interpolate_mobject(0)
+
+    def interpolate_mobject(self, alpha):
+        for mob, fill, stroke in self.opacities:
+            mob.set_fill(opacity=fill * alpha, family=False)
+            mob.set_stroke(opacity=stroke * alpha, family=False)
+
+
+class Recolor(Animation):
+    """Interpolate the fill colour of a mobject's family, leaving points alone."""
+
+    def __init__(self, mobject, color, **kwargs):
+        self.color = ManimColor(color)
+        super().__init__(mobject, **kwargs)
+
+    def begin(self):
+        # Start from whatever colour the mobject has when its turn comes
+        self.start_colors = [
+            (mob, mob.get_fill_color()) for mob in self.mobject.family_members_with_points()
+        ]
+        super().begin()
+
+    def interpolate_mobject(self, alpha):
+        for mob, start in self.start_colors:
+            mob.set_fill(interpolate_color(start, self.color, alpha), family=False)
+
+
+class DeferredTransform(Transform):
+    """Transform into a target that is built when the animation starts.
+
+    ``build(mobject)`` is called with the mobject as it is at that moment,
+    so the target can be placed relative to wherever earlier steps left it.
+    """
+
+    def __init__(self, mobject, build, **kwargs):
+        self.build = build
+        super().__init__(mobject, **kwargs)
+
+    def create_target(self):
+        return self.build(self.mobject)
+
+
+class AnimationPlan:
+    """Collect play/wait steps and issue them in as few play calls as possible.
+
+    Each run of ``play`` steps between two waits becomes one Succession of
+    AnimationGroups, so the timing stays the same while the renderer sees a
+    single animation: one partial movie file, one hash, one scene update.
+    Waits go to ``scene.wait`` on their own. A Wait inside a Succession is
+    rasterised on every frame, while a lone wait over a still scene is drawn
+    once and repeated (or written as a single frame with elided holds). That
+    costs one play call per wait, which is cheap next to redrawing the hold.
+
+    Animations are created when they are added, not when their turn comes,
+    so targets must be placed where mobjects *will* be by then, and anything
+    faded in after the first step has to go through ``reveal``.
+    """
+
+    def __init__(self):
+        self.steps = []
+        self.added = []
+
+    @property
+    def run_time(self):
+        return sum(step.run_time for step in self.steps)
+
+    def play(self, *animations, run_time):
+        introducers = [anim.mobject for anim in animations if anim.is_introducer()]
+        if introducers and self.steps:
+            raise ValueError("only the first step of a plan can introduce mobjects; use reveal()")
+        # Harmless to add these up front: the first step begins before any frame is drawn
+        self.added += introducers
+        self.steps.append(AnimationGroup(*animations, run_time=run_time))
+
+    def wait(self, duration):
+        self.steps.append(Wait(run_time=duration))
+
+    def reveal(self, mobject):
+        """A fade-in that can be used in any step."""
+        self.added.append(mobject)
+        return Reveal(mobject)
+
+    def run(self, scene):
+        if not self.steps:
+            return
+        scene.add(*self.added)
+        moving = []
+        for step in self.steps:
+            if isinstance(step, Wait):
+                play_steps(scene, moving)
+                moving = []
+                scene.wait(step.run_time)
+            else:
+                moving.append(step)
+        play_steps(scene, moving)
+
+
+def play_steps(scene, steps):
+    """Play ``steps`` as one Succession and leave the scene as if each had been played alone.
+
+    Manim adds the Succession's group to the scene, and a remover inside it
+    (a FadeOut) breaks that group up into its members, which are then listed
+    again next to where they already were. Played once per loop iteration,
+    that makes ``scene.mobjects`` and the family walk of every frame grow
+    with the input. Afterwards the scene gets back its own list, minus what
+    was removed, plus anything that only the group held.
+    """
+    if not steps:
+        return
+    before = list(scene.mobjects)
+    succession = Succession(*steps)
+    scene.play(succession)
+
+    present = {id(mob) for mob in scene.get_mobject_family_members()}
+    mobjects = [mob for mob in before if id(mob) in present]
+    covered = {id(member) for mob in mobjects for member in mob.get_family()}
+    for mob in scene.mobjects:
+        if mob is not succession.group and id(mob) not in covered:
+            mobjects.append(mob)
+            covered.update(id(member) for member in mob.get_family())
+    scene.mobjects = mobjects
+    # .animate keeps a copy of its target on the mobject until the next one replaces it
+    for anim in leaf_animations(steps):
+        anim.mobject.__dict__.pop("target", None)
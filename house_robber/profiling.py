@@ -0,0 +1,137 @@
+"""Per-section and per-play render accounting, exported as JSON.
+
+Set ``HOUSE_ROBBER_PROFILE=1`` to write ``<movie>.profile.json`` next to the
+rendered movie, or set it to a path to write the report there instead.
+Profiling traces the Python heap with tracemalloc, which slows allocation
+down, so it is never on in a normal render.
+"""
+import json
+import os
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+def peak_rss_mb():
+    """Peak resident memory over the whole life of this process, in MB."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS and kilobytes on Linux
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def mb(size):
+    return round(size / 2**20, 1)
+
+
+class RenderProfiler:
+    """Collects wall time, frames, live mobjects and peak memory.
+
+    ``play`` covers rasterising and encoding a play or wait; whatever else a
+    section spends its time on (building mobjects, Pango, SVG parsing) is
+    reported as the section's ``build_seconds``.
+
+    Memory is the Python heap traced by tracemalloc. Its peak is reset at
+    the start of every section and play, so each one reports its own peak.
+    The process's ``ru_maxrss`` only ever grows, so it is reported once for
+    the whole render.
+    """
+
+    def __init__(self):
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+        self.started = time.perf_counter()
+        self.sections = []
+        self.plays = []
+        self._section = None
+        self._section_peak = 0
+        self._depth = 0
+
+    @staticmethod
+    def _frames(scene):
+        return round(scene.renderer.time * scene.camera.frame_rate)
+
+    def _peak(self):
+        """Traced peak since the last reset, also counted towards the section's."""
+        peak = tracemalloc.get_traced_memory()[1]
+        self._section_peak = max(self._section_peak, peak)
+        return peak
+
+    @contextmanager
+    def section(self, name, scene):
+        start = time.perf_counter()
+        start_frames = self._frames(scene)
+        first_play = len(self.plays)
+        self._section = name
+        self._section_peak = 0
+        tracemalloc.reset_peak()
+        try:
+            yield
+        finally:
+            self._section = None
+            wall = time.perf_counter() - start
+            play_seconds = sum(play["wall_seconds"] for play in self.plays[first_play:])
+            self._peak()
+            self.sections.append({
+                "name": name,
+                "wall_seconds": round(wall, 4),
+                "play_seconds": round(play_seconds, 4),
+                "build_seconds": round(wall - play_seconds, 4),
+                "frames": self._frames(scene) - start_frames,
+                "plays": len(self.plays) - first_play,
+                "mobjects": len(scene.get_mobject_family_members()),
+                "traced_mb": mb(tracemalloc.get_traced_memory()[0]),
+                "traced_peak_mb": mb(self._section_peak),
+            })
+
+    @contextmanager
+    def play(self, kind, scene):
+        # Scene.wait() is implemented with Scene.play(); only count the outer call
+        if self._depth:
+            yield
+            return
+
+        self._depth += 1
+        start = time.perf_counter()
+        start_frames = self._frames(scene)
+        self._peak()
+        tracemalloc.reset_peak()
+        try:
+            yield
+        finally:
+            self._depth -= 1
+            self.plays.append({
+                "index": len(self.plays),
+                "kind": kind,
+                "section": self._section,
+                "run_time": getattr(scene, "duration", None),
+                "wall_seconds": round(time.perf_counter() - start, 4),
+                "frames": self._frames(scene) - start_frames,
+                "mobjects": len(scene.get_mobject_family_members()),
+                "traced_peak_mb": mb(self._peak()),
+            })
+
+    def report(self, scene, caches=()):
+        return {
+            "scene": type(scene).__name__,
+            "pixel_height": scene.camera.pixel_height,
+            "frame_rate": scene.camera.frame_rate,
+            "wall_seconds": round(time.perf_counter() - self.started, 4),
+            "frames": self._frames(scene),
+            "peak_rss_mb": peak_rss_mb(),
+            "sections": self.sections,
+            "plays": self.plays,
+            "caches": list(caches),
+        }
+
+    def write(self, path, scene, caches=()):
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(self.report(scene, caches), f, indent=2)
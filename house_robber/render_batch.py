@@ -0,0 +1,114 @@
+"""Render one video per line of a JSONL job file.
+
+    python render_batch.py jobs.jsonl -j 6 --out-dir out/
+
+Each line is a job as described in ``jobs.py``; ``id`` defaults to the line
+number and ``output`` to ``<out-dir>/<id>.mp4``. Results, each with its job's
+id, are appended to ``<jobs>.results.jsonl`` as jobs finish. A line that
+isn't a JSON object, or a job that kills its worker process, is logged as a
+failed job and the rest still render. A movie only appears at its output
+path once it is complete, so running the same command again after a crash
+skips every job whose output already exists.
+"""
+import argparse
+import json
+import os
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from itertools import chain
+
+
+def read_jobs(path, out_dir):
+    """(jobs, failed results for the lines that aren't jobs)."""
+    jobs, bad = [], []
+    with open(path) as f:
+        for number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                job = json.loads(line)
+                if not isinstance(job, dict):
+                    raise ValueError(f"expected a JSON object, got {type(job).__name__}")
+            except ValueError as error:
+                bad.append({"id": number, "output": None, "ok": False, "error": f"bad job line {number}: {error}"})
+                continue
+            job.setdefault("id", number)
+            job.setdefault("output", os.path.join(out_dir, f"{job['id']}.mp4"))
+            jobs.append(job)
+    return jobs, bad
+
+
+def run_jobs(jobs, workers):
+    """Render ``jobs`` in a pool of warm workers and yield each result as it finishes.
+
+    A worker that dies (out of memory, a native crash) breaks the pool and
+    every job in flight with it. Only ``workers`` jobs are in flight at a
+    time, and those are retried one by one in a pool of their own, so only
+    the job that kills its worker is logged as failed. The remaining jobs go
+    on in a new pool.
+    """
+    from jobs import render_job, warm_up
+
+    queue = deque(jobs)
+    while queue:
+        lost = []
+        with ProcessPoolExecutor(max_workers=workers, initializer=warm_up) as pool:
+            running = {}
+            while queue or running:
+                while queue and len(running) < workers and not lost:
+                    job = queue.popleft()
+                    running[pool.submit(render_job, job)] = job
+                if not running:
+                    break
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    job = running.pop(future)
+                    try:
+                        yield future.result()
+                    except BrokenProcessPool:
+                        lost.append(job)
+
+        for job in lost:
+            with ProcessPoolExecutor(max_workers=1, initializer=warm_up) as pool:
+                try:
+                    yield pool.submit(render_job, job).result()
+                except BrokenProcessPool as error:
+                    yield {"id": job.get("id"), "output": job.get("output"), "ok": False,
+                           "error": f"{type(error).__name__}: {error}"}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("jobs", help="JSONL job file")
+    parser.add_argument("-j", "--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--out-dir", default="batch")
+    parser.add_argument("--results", default=None, help="results log (default: <jobs>.results.jsonl)")
+    parser.add_argument("--force", action="store_true", help="render jobs whose output already exists")
+    args = parser.parse_args()
+
+    jobs, bad = read_jobs(args.jobs, args.out_dir)
+    todo = [job for job in jobs if args.force or not os.path.exists(job["output"])]
+    print(f"{len(jobs)} jobs, {len(jobs) - len(todo)} already rendered, {len(bad)} bad lines")
+
+    start = time.perf_counter()
+    failed = 0
+    with open(args.results or f"{args.jobs}.results.jsonl", "a") as log:
+        for result in chain(bad, run_jobs(todo, max(1, min(args.workers, len(todo) or 1)))):
+            log.write(json.dumps(result) + "\n")
+            log.flush()
+            if result["ok"]:
+                print(f"{result['seconds']:7.1f}s  {result['output']}")
+            else:
+                failed += 1
+                print(f" FAILED   {result['id']}: {result['error']}")
+
+    print(f"Rendered {len(todo) + len(bad) - failed}/{len(todo) + len(bad)} jobs in {time.perf_counter() - start:.1f}s")
+    if failed:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""A local render server that keeps manim and the scene caches warm.
+
+    python render_daemon.py serve -j 4
+    python render_daemon.py submit --houses 2,7,9,3,1 -q l -o out/job1.mp4
+
+The server listens on localhost. Clients send JSON jobs one per line (see
+``jobs.py``), close their side of the connection, and get one JSON result
+line back per job in the order they were sent. Jobs from all connections
+share one pool of ``-j`` worker processes, and every worker is warmed up
+once when it starts.
+"""
+import argparse
+import json
+import os
+import socket
+import socketserver
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+DEFAULT_PORT = 8765
+
+
+class RenderServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, address, jobs):
+        super().__init__(address, JobHandler)
+        self.jobs = jobs
+        self.lock = threading.Lock()
+        self.pool = self.new_pool()
+
+    def new_pool(self):
+        from jobs import warm_up
+
+        return ProcessPoolExecutor(max_workers=self.jobs, initializer=warm_up)
+
+    def restart_pool(self, broken):
+        """Replace a pool that lost a worker, unless another connection already has."""
+        with self.lock:
+            if self.pool is broken:
+                broken.shutdown(wait=False, cancel_futures=True)
+                self.pool = self.new_pool()
+            return self.pool
+
+    def submit(self, job):
+        """(pool, future) for a job, on a fresh pool if the current one is broken."""
+        from jobs import render_job
+
+        pool = self.pool
+        try:
+            return pool, pool.submit(render_job, job)
+        except BrokenProcessPool:
+            pool = self.restart_pool(pool)
+            return pool, pool.submit(render_job, job)
+
+    def server_close(self):
+        super().server_close()
+        self.pool.shutdown(cancel_futures=True)
+
+
+class JobHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        # Submit everything on the connection first so its jobs run side by side
+        submitted = []
+        for line in self.rfile:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                job = json.loads(line)
+                if not isinstance(job, dict):
+                    raise ValueError(f"expected a JSON object, got {type(job).__name__}")
+            except ValueError as error:
+                submitted.append({"ok": False, "error": f"bad job line: {error}"})
+                continue
+            submitted.append((job, *self.server.submit(job)))
+        for entry in submitted:
+            result = entry if isinstance(entry, dict) else self.result(*entry)
+            self.wfile.write((json.dumps(result) + "\n").encode())
+
+    def result(self, job, pool, future):
+        try:
+            return future.result()
+        except BrokenProcessPool as error:
+            # A worker died (killed, out of memory, crashed in native code), taking
+            # the pool with it; later jobs get a new one
+            self.server.restart_pool(pool)
+            return {"id": job.get("id"), "output": job.get("output"), "ok": False, "error": f"{type(error).__name__}: {error}"}
+
+
+def submit(jobs, port=DEFAULT_PORT):
+    """Send jobs to a running server and return their results."""
+    with socket.create_connection(("127.0.0.1", port)) as conn:
+        conn.sendall("".join(json.dumps(job) + "\n" for job in jobs).encode())
+        # End of input tells the server the last job has been sent
+        conn.shutdown(socket.SHUT_WR)
+        with conn.makefile("rb") as results:
+            return [json.loads(line) for line in results]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    commands = parser.add_subparsers(dest="command", required=True)
+    serve = commands.add_parser("serve", help="run the render server")
+    serve.add_argument("-j", "--jobs", type=int, default=os.cpu_count())
+    send = commands.add_parser("submit", help="render one job on a running server")
+    send.add_argument("--houses", required=True, help="comma-separated house values")
+    send.add_argument("--mode", choices=["slow", "fast"], default="fast")
+    send.add_argument("-q", "--quality", choices=["l", "m", "h", "k"], default="m")
+    send.add_argument("-o", "--output", required=True)
+    args = parser.parse_args()
+
+    if args.command == "serve":
+        with RenderServer(("127.0.0.1", args.port), args.jobs) as server:
+            print(f"Rendering with {args.jobs} workers on 127.0.0.1:{args.port}")
+            try:
+                server.serve_forever()
+            except KeyboardInterrupt:
+                pass
+        return
+
+    job = {"houses": [int(v) for v in args.houses.split(",")], "mode": args.mode,
+           "quality": args.quality, "output": args.output}
+    result, = submit([job], args.port)
+    print(json.dumps(result))
+
+
+if __name__ == "__main__":
+    main()
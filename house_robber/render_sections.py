@@ -0,0 +1,187 @@
+"""Render HouseRobber's sections in parallel and join them losslessly.
+
+Each section of ``HouseRobber.sections()`` is rendered as its own scene in a
+process pool, then the movies are stream-copied into one file:
+
+    python render_sections.py -q h -j 6
+
+Rendered sections are kept in a content-addressed cache, so after editing one
+example only that example is rendered again.
+"""
+import argparse
+import hashlib
+import inspect
+import os
+import shutil
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+QUALITIES = {
+    "l": "low_quality",
+    "m": "medium_quality",
+    "h": "high_quality",
+    "k": "fourk_quality",
+}
+
+
+def scene_sections(scene_cls):
+    # sections() only looks up bound methods, so an uninitialised instance will do
+    return scene_cls.sections(object.__new__(scene_cls))
+
+
+def section_fingerprints(scene_cls, quality):
+    """A content hash per section name, covering everything its video depends on.
+
+    That is the section method's source and arguments, plus what every
+    section shares: the helper methods and modules, theme constants, icon
+    files, quality, manim version and the scene's render switches.
+    """
+    import caches
+    import dp
+    import layers
+    import manim
+    import plan
+    import scene
+    import video
+
+    sections = scene_sections(scene_cls)
+    section_methods = {method.__name__ for _, method, _ in sections}
+
+    shared = hashlib.sha256()
+    shared.update(f"{manim.__version__} {QUALITIES[quality]}".encode())
+    # Set from HOUSE_ROBBER_* variables, or overridden by a subclass
+    shared.update(f"elide_holds={scene_cls.elide_holds} layered={scene_cls.layered}".encode())
+    for name, member in inspect.getmembers(scene_cls, inspect.isfunction):
+        if member.__module__ == scene.__name__ and name not in section_methods:
+            shared.update(inspect.getsource(member).encode())
+    for source in (scene.HouseRow, scene.RowRestyle, scene.HouseViewport, caches, dp, layers, plan, video):
+        shared.update(inspect.getsource(source).encode())
+    for name, value in sorted(vars(scene).items()):
+        # manim's own constants are covered by its version
+        if getattr(manim, name, None) is value:
+            continue
+        if name.isupper() and isinstance(value, (str, int, float, dict, tuple)):
+            shared.update(f"{name}={value!r}".encode())
+    for icon in sorted(os.listdir(scene.ICON_DIR)):
+        with open(os.path.join(scene.ICON_DIR, icon), "rb") as f:
+            shared.update(icon.encode() + f.read())
+
+    fingerprints = {}
+    for name, method, kwargs in sections:
+        digest = shared.copy()
+        digest.update(f"{name} {sorted(kwargs.items())!r}".encode())
+        digest.update(inspect.getsource(method).encode())
+        fingerprints[name] = digest.hexdigest()
+    return fingerprints
+
+
+class SectionCache:
+    """Directory of rendered section movies named by fingerprint.
+
+    When the total size goes over ``max_bytes`` the least recently used
+    movies are deleted.
+    """
+
+    def __init__(self, path, max_bytes):
+        self.path = path
+        self.max_bytes = max_bytes
+        os.makedirs(path, exist_ok=True)
+
+    def _file(self, key):
+        return os.path.join(self.path, f"{key}.mp4")
+
+    def get(self, key):
+        path = self._file(key)
+        if not os.path.exists(path):
+            return None
+        os.utime(path)  # mark as recently used
+        return path
+
+    def put(self, key, movie_path):
+        path = self._file(key)
+        shutil.copyfile(movie_path, f"{path}.tmp")
+        os.replace(f"{path}.tmp", path)
+        return path
+
+    def evict(self):
+        entries = [os.path.join(self.path, name) for name in os.listdir(self.path) if name.endswith(".mp4")]
+        entries.sort(key=os.path.getmtime, reverse=True)
+        total = 0
+        for path in entries:
+            total += os.path.getsize(path)
+            if total > self.max_bytes:
+                os.remove(path)
+
+
+def render_section(name, quality, media_dir):
+    """Render a single section in this process and return (movie path, seconds)."""
+    from manim import tempconfig
+
+    from scene import HouseRobber
+
+    section_scene = type(f"HouseRobber_{name}", (HouseRobber,), {"section_names": (name,)})
+    start = time.perf_counter()
+    with tempconfig({
+        "quality": QUALITIES[quality],
+        "media_dir": media_dir,
+        "output_file": section_scene.__name__,
+        # Elided holds need every play rendered, not taken from manim's cache
+        "disable_caching": section_scene.elide_holds,
+        "verbosity": "WARNING",
+    }):
+        scene = section_scene()
+        scene.render()
+        movie_path = str(scene.renderer.file_writer.movie_file_path)
+    return movie_path, time.perf_counter() - start
+
+
+def main():
+    from scene import HouseRobber
+    from video import concat_videos
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-q", "--quality", choices=QUALITIES, default="m")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count())
+    parser.add_argument("--media-dir", default="media")
+    parser.add_argument("-o", "--output", default=None, help="joined movie path")
+    parser.add_argument("--cache-dir", default=None, help="section cache (default: <media-dir>/section_cache)")
+    parser.add_argument("--cache-size", type=int, default=2048, help="section cache limit in MB")
+    parser.add_argument("--no-cache", action="store_true", help="render every section and leave the cache alone")
+    args = parser.parse_args()
+
+    names = [name for name, _, _ in scene_sections(HouseRobber)]
+    fingerprints = section_fingerprints(HouseRobber, args.quality)
+    cache = None
+    if not args.no_cache:
+        cache = SectionCache(args.cache_dir or os.path.join(args.media_dir, "section_cache"), args.cache_size * 2**20)
+    output = args.output or os.path.join(args.media_dir, "videos", f"HouseRobber_{args.quality}.mp4")
+
+    start = time.perf_counter()
+    movies = {}
+    if cache is not None:
+        for name in names:
+            movies[name] = cache.get(fingerprints[name])
+    todo = [name for name in names if not movies.get(name)]
+
+    if todo:
+        with ProcessPoolExecutor(max_workers=max(1, min(args.jobs, len(todo)))) as pool:
+            futures = {name: pool.submit(render_section, name, args.quality, args.media_dir) for name in todo}
+            for name, future in futures.items():
+                path, seconds = future.result()
+                movies[name] = cache.put(fingerprints[name], path) if cache is not None else path
+                print(f"{name:<20} {seconds:6.1f}s  rendered")
+
+    for name in names:
+        if name not in todo:
+            print(f"{name:<20}          cached")
+
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    concat_videos([movies[name] for name in names], output)
+    # Only evict once the join no longer needs this run's sections
+    if cache is not None:
+        cache.evict()
+    print(f"Joined {len(names)} sections in {time.perf_counter() - start:.1f}s -> {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""Render one long example in time shards across processes and join them.
+
+    python render_shards.py --houses 2,7,9,3,1,5,8,2,4,6 -q h -j 6 -o long.mp4
+
+A dry run (see ``storyboard.py``) lists every play with its run time, and the
+plays are cut into ``-j`` runs of about equal video length. Each worker
+replays the whole example with animations skipped up to its first play, the
+same way ``manim -n`` does, renders its own plays and ends the scene there.
+Every play is its own partial movie in manim, so stream-copying the shards
+back together gives the same packets as a sequential render.
+"""
+import argparse
+import os
+import time
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
+from itertools import accumulate
+
+from render_sections import QUALITIES
+
+
+def plan_shards(timeline, shards):
+    """Split the plays into ``shards`` contiguous (first, last) ranges of similar duration.
+
+    Returns fewer ranges only when there are fewer plays than shards.
+    """
+    plays = timeline["plays"]
+    shards = max(1, min(shards, len(plays)))
+    ends = list(accumulate(play["run_time"] for play in plays))
+    ranges = []
+    first = 0
+    for k in range(1, shards):
+        # Shard k - 1 ends with the play that reaches its share of the video,
+        # but takes at least one play and leaves at least one for each later shard
+        last = bisect_left(ends, ends[-1] * k / shards - 1e-9)
+        last = min(max(last, first), len(plays) - 1 - (shards - k))
+        ranges.append((first, last))
+        first = last + 1
+    ranges.append((first, len(plays) - 1))
+    return ranges
+
+
+def shard_scene(scene_cls, index, last):
+    """Subclass of ``scene_cls`` that ends the scene once play ``last`` is done.
+
+    manim's own ``upto_animation_number`` is ignored when it is 0, which
+    would make a shard of just the first play render the whole scene.
+    """
+    from manim.utils.exceptions import EndSceneEarlyException
+
+    def play(self, *args, **kwargs):
+        # Scene.wait() plays too, so this counts plays the way the dry run does
+        if self.renderer.num_plays > last:
+            raise EndSceneEarlyException()
+        scene_cls.play(self, *args, **kwargs)
+
+    # A name of its own gives every shard its own partial movie directory.
+    # Holds are never elided, as in the dry run the plays were counted from.
+    return type(f"{scene_cls.__name__}_shard{index}", (scene_cls,), {"elide_holds": False, "play": play})
+
+
+def render_shard(example, quality, first, last, media_dir, index):
+    """Render plays ``first``..``last`` of an example; returns (movie path, seconds)."""
+    from manim import tempconfig
+
+    from scene import example_scene
+
+    scene_cls = shard_scene(example_scene(**example), index, last)
+    start = time.perf_counter()
+    with tempconfig({
+        "quality": QUALITIES[quality],
+        "media_dir": media_dir,
+        "output_file": scene_cls.__name__,
+        "from_animation_number": first,
+        "verbosity": "WARNING",
+    }):
+        scene = scene_cls()
+        scene.render()
+        movie_path = str(scene.renderer.file_writer.movie_file_path)
+    return movie_path, time.perf_counter() - start
+
+
+def main():
+    from scene import example_scene
+    from storyboard import dry_run
+    from video import concat_videos
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--houses", required=True, help="comma-separated house values")
+    parser.add_argument("--mode", choices=["slow", "fast"], default="fast")
+    parser.add_argument("--box-size", type=float, default=0.9)
+    parser.add_argument("--box-buff", type=float, default=0.12)
+    parser.add_argument("-q", "--quality", choices=QUALITIES, default="m")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count())
+    parser.add_argument("--media-dir", default="media")
+    parser.add_argument("-o", "--output", default=None)
+    args = parser.parse_args()
+
+    example = dict(houses=[int(v) for v in args.houses.split(",")], mode=args.mode,
+                   box_size=args.box_size, box_buff=args.box_buff)
+    output = args.output or os.path.join(args.media_dir, "videos", f"HouseRobberExample_{args.quality}.mp4")
+
+    start = time.perf_counter()
+    shards = plan_shards(dry_run(example_scene(**example)), args.jobs)
+    with ProcessPoolExecutor(max_workers=len(shards)) as pool:
+        futures = [
+            pool.submit(render_shard, example, args.quality, first, last, args.media_dir, i)
+            for i, (first, last) in enumerate(shards)
+        ]
+        movies = []
+        for (first, last), future in zip(shards, futures):
+            path, seconds = future.result()
+            movies.append(path)
+            print(f"plays {first:>5}-{last:<5} {seconds:6.1f}s")
+
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    concat_videos(movies, output)
+    print(f"Joined {len(shards)} shards in {time.perf_counter() - start:.1f}s -> {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+"""Renderers that get more than one movie out of a single construct() pass."""
+import os
+
+from manim import config
+from manim.camera.camera import Camera
+from manim.renderer.cairo_renderer import CairoRenderer
+from manim.utils.iterables import list_update
+
+from video import FrameEncoder
+
+
+def pixel_size(height):
+    """16:9 pixel size for a height, with an even width as H.264 needs."""
+    return 2 * round(height * 16 / 9 / 2), height
+
+
+class MultiResolutionRenderer(CairoRenderer):
+    """Rasterises every frame once per extra resolution, next to the main one.
+
+    The main camera renders at the configured quality and goes through
+    manim's normal movie writer. Each height in ``extra_heights`` gets its
+    own camera, and its frames go straight to a ``FrameEncoder`` at the same
+    frame rate. The movies are written as ``<movie>_<height>p.mp4``.
+
+    Scenes, mobjects and animations are built once; only rasterising and
+    encoding are repeated. Needs ``disable_caching``, since a cached play
+    would skip the extra cameras.
+    """
+
+    def __init__(self, extra_heights, **kwargs):
+        super().__init__(**kwargs)
+        self.extra_heights = list(extra_heights)
+        self.extra_cameras = []
+        self.extra_statics = []
+        self.encoders = []
+
+    def init_scene(self, scene):
+        super().init_scene(scene)
+        self.extra_cameras = []
+        for height in self.extra_heights:
+            width, height = pixel_size(height)
+            self.extra_cameras.append(Camera(pixel_width=width, pixel_height=height, frame_rate=self.camera.frame_rate))
+        self.extra_statics = [None] * len(self.extra_cameras)
+
+    def extra_movie_paths(self):
+        stem, ext = os.path.splitext(str(self.file_writer.movie_file_path))
+        return [f"{stem}_{height}p{ext or '.mp4'}" for height in self.extra_heights]
+
+    def _open_encoders(self):
+        self.encoders = [
+            FrameEncoder(path, camera.pixel_width, camera.pixel_height, camera.frame_rate)
+            for path, camera in zip(self.extra_movie_paths(), self.extra_cameras)
+        ]
+
+    def update_frame(self, scene, mobjects=None, include_submobjects=True, ignore_skipping=True, **kwargs):
+        super().update_frame(scene, mobjects, include_submobjects, ignore_skipping, **kwargs)
+        if self.skip_animations and not ignore_skipping:
+            return
+        if not mobjects:
+            mobjects = list_update(scene.mobjects, scene.foreground_mobjects)
+        kwargs["include_submobjects"] = include_submobjects
+        for i, camera in enumerate(self.extra_cameras):
+            if camera.background_color != self.camera.background_color:
+                camera.background_color = self.camera.background_color
+            if self.static_image is not None and self.extra_statics[i] is not None:
+                camera.set_frame_to_background(self.extra_statics[i])
+            else:
+                camera.reset()
+            camera.capture_mobjects(mobjects, **kwargs)
+
+    def save_static_frame_data(self, scene, static_mobjects):
+        super().save_static_frame_data(scene, static_mobjects)
+        # super() left every extra camera holding just the static mobjects
+        self.extra_statics = [
+            None if self.static_image is None else camera.pixel_array.copy()
+            for camera in self.extra_cameras
+        ]
+        return self.static_image
+
+    def add_frame(self, frame, num_frames=1):
+        if not self.skip_animations and config.write_to_movie:
+            if not self.encoders:
+                self._open_encoders()
+            for camera, encoder in zip(self.extra_cameras, self.encoders):
+                encoder.write(camera.pixel_array, num_frames)
+        super().add_frame(frame, num_frames)
+
+    def scene_finished(self, scene):
+        super().scene_finished(scene)
+        for encoder in self.encoders:
+            encoder.close()
+        self.encoders = []
+
+
+class StreamingRenderer(CairoRenderer):
+    """Sends every frame to one encoder instead of a partial movie per play.
+
+    Writes a single fragmented MP4 that can be read while it grows or, with
+    ``segment_seconds``, an HLS playlist of segments about that long. Run
+    with ``write_to_movie`` and caching off so manim writes no partial
+    movies of its own.
+
+    Frames that manim would repeat, such as frozen waits and the scene's
+    elided still holds, are encoded once and held, so the output is variable
+    frame rate and needs no retiming afterwards.
+    """
+
+    def __init__(self, output, segment_seconds=None, **kwargs):
+        super().__init__(**kwargs)
+        self.output = str(output)
+        self.segment_seconds = segment_seconds
+        self.encoder = None
+        self.holds_applied = 0
+
+    def init_scene(self, scene):
+        super().init_scene(scene)
+        self.scene = scene
+
+    def _open_encoder(self):
+        width, height, fps = self.camera.pixel_width, self.camera.pixel_height, self.camera.frame_rate
+        if self.segment_seconds:
+            segments = os.path.splitext(self.output)[0] + "_%05d.ts"
+            self.encoder = FrameEncoder(
+                self.output, width, height, fps, format="hls", gop=round(fps * self.segment_seconds),
+                options={"hls_time": str(self.segment_seconds), "hls_list_size": "0",
+                         "hls_segment_filename": segments},
+            )
+        else:
+            self.encoder = FrameEncoder(self.output, width, height, fps,
+                                        options={"movflags": "frag_keyframe+empty_moov"})
+
+    def _apply_holds(self):
+        # HouseRobber.wait() records a hold right after writing its single frame
+        holds = getattr(self.scene, "holds", [])
+        for _, extra in holds[self.holds_applied:]:
+            self.encoder.hold(extra)
+        self.holds_applied = len(holds)
+
+    def add_frame(self, frame, num_frames=1):
+        if self.skip_animations:
+            return
+        self.time += num_frames / self.camera.frame_rate
+        if self.encoder is None:
+            self._open_encoder()
+        self._apply_holds()
+        self.encoder.write(frame)
+        if num_frames > 1:
+            self.encoder.hold(num_frames - 1)
+
+    def scene_finished(self, scene):
+        super().scene_finished(scene)
+        if self.encoder is not None:
+            self._apply_holds()
+            self.encoder.close()
+            self.encoder = None
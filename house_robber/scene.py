@@ -1,5 +1,15 @@
 from manim import *
 import os
+from collections import deque
+from contextlib import nullcontext
+from itertools import islice
+
+from caches import GlyphCache, MobjectCache
+from dp import dp_trace, pace, validate_houses
+from layers import split_layers
+from plan import AnimationPlan, DeferredTransform, Recolor
+from profiling import RenderProfiler
+from video import retime_holds
 
 # VS Code Dark Theme colors
 DARK_BG = "#1e1e1e"
@@ -18,108 +28,493 @@ FONT_MONO = "Menlo"
 
 CORNER_RADIUS = 0.12
 
+# (fill, text, icon) colors for each (card kind, highlighted)
+CARD_STYLES = {
+    ("house", False): (CARD_LIGHT, TEXT_PRIMARY, TEXT_SECONDARY),
+    ("house", True): (ACCENT_WARM, TEXT_DARK, TEXT_DARK),
+    ("person", False): (CARD_BG, TEXT_PRIMARY, TEXT_SECONDARY),
+    ("person", True): (ACCENT_WARM, TEXT_DARK, TEXT_DARK),
+    ("loot", False): (CARD_BG, TEXT_PRIMARY, ACCENT_GREEN),
+    ("loot", True): (ACCENT_WARM, TEXT_DARK, TEXT_DARK),
+}
+CARD_ICONS = {"house": "home", "person": "person", "loot": "briefcase"}
+CARD_VALUE_OFFSETS = {"house": ORIGIN, "person": DOWN * 0.05, "loot": DOWN * 0.05}
+
+# Video seconds of one detailed run_example_fast iteration (on average) and of one batched sweep
+FAST_STEP_SECONDS = 1.6
+FAST_SWEEP_SECONDS = 1.2
+
+# Set to 1 to write <movie>.profile.json next to the video, or to a report path
+PROFILE = os.environ.get("HOUSE_ROBBER_PROFILE", "")
+# Set to 1 to encode each still hold as one frame and stretch it afterwards
+ELIDE_HOLDS = os.environ.get("HOUSE_ROBBER_ELIDE_HOLDS", "") not in ("", "0")
+# Set to 1 to redraw only what each animation touches over a cached background
+LAYERED = os.environ.get("HOUSE_ROBBER_LAYERED", "") not in ("", "0")
+
 # Path to icons
 ICON_DIR = os.path.join(os.path.dirname(__file__), "icons")
 
+# Parsed SVGs keyed by icon name, and styled icons keyed by (name, size, color)
+SVG_CACHE = MobjectCache("svg", maxsize=8)
+ICON_CACHE = MobjectCache("icon", maxsize=64)
+# Fully built cards keyed by (kind, label, value, box_size, highlighted)
+CARD_CACHE = MobjectCache("card", maxsize=512)
+# Digits, operators and calc strings assembled from glyphs rendered once
+GLYPH_CACHE = GlyphCache(mono_fonts=[FONT_MONO])
+# Laid out and fitted panel text keyed by (string, font, size, line_spacing, max_width)
+TEXT_CACHE = MobjectCache("text", maxsize=256)
+
+
+class HouseRow(VGroup):
+    """The idle cells of a house row, drawn as a few merged mobjects.
+
+    Each part of a card (box, icon, value, index label) has one VMobject per
+    style, holding the points of every cell in that style. A row of n houses
+    is 8 mobjects instead of about 8n, and cells are placed and restyled
+    with NumPy masks over ``highlighted`` and ``flagged``. Those hold the
+    shown cells only, cell j in slot ``j % window``, so the row costs the
+    same however long the input is.
+
+    While a cell is animated it is lifted into mobjects of its own (see
+    ``RowRestyle``) and merged back when the play is over. The row only
+    keeps geometry, never the scene, since ``.animate`` deep-copies it.
+    """
+
+    PARTS = ("box", "icon", "value", "label")
+
+    def __init__(self, window, templates, left_x, step, y):
+        super().__init__()
+        self.templates = templates
+        self.left_x = left_x
+        self.step = step
+        self.y = y
+        self.offset = 0
+        self.window = window
+        self.highlighted = np.zeros(window, dtype=bool)
+        self.flagged = np.zeros(window, dtype=bool)
+        # Value and label points relative to the cell centre, for shown cells
+        self.cell_points = {}
+        self.lifted = {}
+        self.layers = {(part, state): self.part_mobject(part, state) for part in self.PARTS for state in (False, True)}
+        self.add(*self.layers.values())
+
+    @staticmethod
+    def part_color(part, state):
+        if part == "label":
+            return ACCENT_RED if state else TEXT_SECONDARY
+        fill_color, text_color, icon_color = CARD_STYLES["house", state]
+        return {"box": fill_color, "icon": icon_color, "value": text_color}[part]
+
+    def part_mobject(self, part, state):
+        mob = VMobject()
+        mob.set_fill(self.part_color(part, state), opacity=0.95 if part == "box" else 1)
+        mob.set_stroke(width=0)
+        return mob
+
+    def state(self, part, j):
+        return (self.flagged if part == "label" else self.highlighted)[j % self.window]
+
+    def set_state(self, part, j, state):
+        (self.flagged if part == "label" else self.highlighted)[j % self.window] = state
+
+    def x(self, j):
+        return self.left_x + (j - self.offset) * self.step
+
+    def centers(self, cells):
+        return np.stack([self.x(cells), np.full(len(cells), self.y), np.zeros(len(cells))], axis=1)
+
+    def part_points(self, part, cells, centers):
+        if not len(cells):
+            return np.zeros((0, 3))
+        if part in self.templates:
+            return (self.templates[part][None] + centers[:, None]).reshape(-1, 3)
+        index = self.PARTS.index(part) - 2
+        return np.concatenate([self.cell_points[j][index] + center for j, center in zip(cells, centers)])
+
+    def rebuild(self):
+        cells = np.array(sorted(self.cell_points.keys() - self.lifted.keys()), dtype=int)
+        centers = self.centers(cells)
+        for (part, state), layer in self.layers.items():
+            mask = (self.flagged if part == "label" else self.highlighted)[cells % self.window] == state
+            layer.points = self.part_points(part, cells[mask], centers[mask])
+
+    def show(self, cells):
+        """Add cells, given as {index: (value points, label points)}."""
+        self.cell_points.update(cells)
+        self.rebuild()
+
+    def hide(self, cells):
+        for j in cells:
+            self.cell_points.pop(j, None)
+            # The slot goes to the cell scrolling in next
+            self.highlighted[j % self.window] = self.flagged[j % self.window] = False
+        self.rebuild()
+
+    def lift(self, j):
+        """Give cell j mobjects of its own, {part: VMobject}, until ``settle``."""
+        if j not in self.lifted:
+            center = self.centers(np.array([j]))
+            parts = {}
+            for part in self.PARTS:
+                parts[part] = self.part_mobject(part, self.state(part, j))
+                parts[part].points = self.part_points(part, [j], center)
+            self.lifted[j] = parts
+            self.add(*parts.values())
+            self.rebuild()
+        return self.lifted[j]
+
+    def settle(self):
+        """Merge every lifted cell back into the layers."""
+        if self.lifted:
+            self.remove(*[mob for parts in self.lifted.values() for mob in parts.values()])
+            self.lifted = {}
+            self.rebuild()
+
+
+class RowRestyle(Animation):
+    """Highlight or flag one cell of a HouseRow by interpolating its colours."""
+
+    def __init__(self, row, cell, highlighted=None, flagged=None, **kwargs):
+        self.cell = cell
+        self.states = {}
+        if highlighted is not None:
+            self.states.update(box=highlighted, icon=highlighted, value=highlighted)
+        if flagged is not None:
+            self.states["label"] = flagged
+        super().__init__(row, **kwargs)
+
+    def create_starting_mobject(self):
+        # Colours are interpolated directly; no need to copy the whole row
+        return Mobject()
+
+    def begin(self):
+        row = self.mobject
+        parts = row.lift(self.cell)
+        self.changes = [
+            (parts[part], row.part_color(part, row.state(part, self.cell)), row.part_color(part, state))
+            for part, state in self.states.items()
+        ]
+        for part, state in self.states.items():
+            row.set_state(part, self.cell, state)
+        super().begin()
+
+    def interpolate_mobject(self, alpha):
+        for mob, start, end in self.changes:
+            mob.set_fill(interpolate_color(start, end, alpha), family=False)
+
+    def clean_up_from_scene(self, scene):
+        super().clean_up_from_scene(scene)
+        self.mobject.settle()
+
+
+class HouseViewport:
+    """The window of a long house row that currently exists as mobjects.
+
+    Only ``size`` houses (as many as fit on screen) are ever built. Once the
+    cursor reaches the middle column the row scrolls left instead: houses
+    are built just before they scroll in and dropped as they scroll out.
+
+    Settled houses live in one ``HouseRow``. Houses scrolling in or out are
+    ordinary cards until the next scroll.
+    """
+
+    def __init__(self, scene, houses, box_size, box_buff, bottom_buff):
+        self.scene = scene
+        self.houses = houses
+        self.box_size = box_size
+        self.step = box_size + box_buff
+        self.size = min(len(houses), max(3, int((config.frame_width - 1) // self.step)))
+        self.follow_col = self.size // 2
+        self.y = -config.frame_height / 2 + bottom_buff + box_size / 2
+        self.left_x = -(self.size - 1) * self.step / 2
+        self.entering = {}
+
+        template = scene.create_house_box(0, box_size)
+        template.shift(-template[0].get_center())
+        self.outline = template[0]
+        templates = {"box": template[0].points, "icon": self.points(template[1])}
+        self.row = HouseRow(self.size, templates, self.left_x, self.step, self.y)
+        self.row.show({j: self.cell_points(j) for j in range(self.size)})
+
+    @property
+    def offset(self):
+        return self.row.offset
+
+    def x(self, j):
+        return self.row.x(j)
+
+    def shows(self, j):
+        return self.offset <= j < self.offset + self.size
+
+    @staticmethod
+    def points(mob):
+        return np.concatenate([sub.points for sub in mob.family_members_with_points()])
+
+    def label(self, j, flagged):
+        color = ACCENT_RED if flagged else TEXT_SECONDARY
+        return GLYPH_CACHE.text(str(j), FONT_MONO, 12, color)
+
+    def cell_points(self, j):
+        """Value and label points of house j, relative to its centre."""
+        text = self.scene.create_card_value("house", str(self.houses[j]), self.box_size, TEXT_PRIMARY)
+        text.move_to(CARD_VALUE_OFFSETS["house"])
+        label = self.label(j, False)
+        label.next_to(self.outline, DOWN, buff=0.1)
+        return self.points(text), self.points(label)
+
+    def card(self, j):
+        """House j as a standalone card and label, where the row would draw it."""
+        box = self.scene.create_house_box(self.houses[j], self.box_size, bool(self.row.state("box", j)))
+        box.move_to([self.x(j), self.y, 0])
+        idx = self.label(j, self.row.state("label", j))
+        idx.next_to(box, DOWN, buff=0.1)
+        return VGroup(box, idx)
+
+    def restyle(self, j, highlighted=None, flagged=None):
+        """Animations that highlight and/or flag house j."""
+        if j not in self.entering:
+            return [RowRestyle(self.row, j, highlighted=highlighted, flagged=flagged)]
+
+        box, idx = self.entering[j]
+        anims = []
+        if highlighted is not None:
+            anims += self.scene.update_card(box, highlighted=highlighted)
+            for part in ("box", "icon", "value"):
+                self.row.set_state(part, j, highlighted)
+        if flagged is not None and flagged != self.row.state("label", j):
+            anims.append(Recolor(idx, ACCENT_RED if flagged else TEXT_SECONDARY))
+            self.row.set_state("label", j, flagged)
+        return anims
+
+    def scroll_to(self, i):
+        """Animations that bring house i to the follow column, if it isn't there yet."""
+        offset = min(max(i - self.follow_col, 0), len(self.houses) - self.size)
+        if offset <= self.offset:
+            return []
+
+        # Houses that scrolled in last time join the row where they now stand
+        if self.entering:
+            self.scene.remove(*self.entering.values())
+            self.row.show({j: self.cell_points(j) for j in self.entering})
+            self.entering = {}
+
+        # Usually one column; a batched sweep can jump further than the window is wide
+        old = self.offset
+        leaving = range(old, min(offset, old + self.size))
+        entering = range(max(old + self.size, offset), offset + self.size)
+        shift = LEFT * self.step * (offset - old)
+
+        anims = []
+        for j in leaving:
+            card = self.card(j)
+            self.scene.add(card)
+            anims.append(FadeOut(card, shift=shift))
+        self.row.hide(leaving)
+        anims.append(self.row.animate.shift(shift))
+
+        self.row.offset = offset
+        for j in entering:
+            self.entering[j] = self.card(j)
+            anims.append(FadeIn(self.entering[j], shift=shift))
+        return anims
+
 
 class HouseRobber(Scene):
+    # Names of the sections to render; None renders the whole video
+    section_names = None
+    profiler = None
+    elide_holds = ELIDE_HOLDS
+    layered = LAYERED
+
+    def setup(self):
+        # (frame index, extra frames) for every still hold written as a single frame
+        self.holds = []
+        if self.elide_holds and (not config.disable_caching or config.from_animation_number):
+            # Holds are placed by renderer.time, which a cached or skipped (-n) play
+            # advances by its duration instead of by the frames it wrote
+            logger.warning("Still holds are only elided with --disable_caching and without -n")
+            self.elide_holds = False
+        if PROFILE not in ("", "0"):
+            self.profiler = RenderProfiler()
+
+    def render(self, preview=False):
+        result = super().render(preview)
+        if self.holds and config.write_to_movie:
+            retime_holds(self.renderer.file_writer.movie_file_path, self.holds)
+        return result
+
     def construct(self):
         self.camera.background_color = DARK_BG
 
-        self.title_screen()
-        self.problem_statement()
-
-        # Example 1: Slow with detailed steps
-        self.example_header("Example 1: Step by Step")
-        self.run_example_slow([1, 2, 3, 1], box_size=1.1, box_buff=0.2)
-
-        # Example 2: Fast - more complex
-        self.example_header("Example 2: A More Complex Case")
-        self.run_example_fast([2, 7, 9, 3, 1, 5, 8, 2, 4, 6], box_size=0.9, box_buff=0.12)
-
-        self.show_code()
-        self.end_screen()
+        for name, section, kwargs in self.sections():
+            if self.section_names is None or name in self.section_names:
+                self.next_section(name)
+                with self.profiler.section(name, self) if self.profiler else nullcontext():
+                    section(**kwargs)
+
+    def play(self, *args, **kwargs):
+        with self.profiler.play("play", self) if self.profiler else nullcontext():
+            super().play(*args, **kwargs)
+
+    def wait(self, duration=DEFAULT_WAIT_TIME, stop_condition=None, **kwargs):
+        with self.profiler.play("wait", self) if self.profiler else nullcontext():
+            fps = self.camera.frame_rate
+            frames = int(duration * fps)
+            if not self.elide_holds or frames < 2 or stop_condition or self.should_update_mobjects():
+                super().wait(duration, stop_condition, **kwargs)
+                return
+
+            # Nothing moves: write the frame once and stretch it when the movie is done
+            start = round(self.renderer.time * fps)
+            super().wait(1 / fps, **kwargs)
+            if round(self.renderer.time * fps) == start + 1:
+                self.holds.append((start, frames - 1))
+
+    def get_moving_and_static_mobjects(self, animations):
+        layers = split_layers(self, animations) if self.layered else None
+        if layers is None:
+            return super().get_moving_and_static_mobjects(animations)
+        return layers
+
+    def sections(self):
+        """The video as (name, method, kwargs) triples.
+
+        Every section starts and ends on an empty screen, so each one can be
+        rendered on its own and the movies joined afterwards.
+        """
+        return [
+            ("title_screen", self.title_screen, {}),
+            ("problem_statement", self.problem_statement, {}),
+            # Example 1: Slow with detailed steps
+            ("example_1", self.run_example, dict(
+                title_text="Example 1: Step by Step",
+                houses=[1, 2, 3, 1], mode="slow", box_size=1.1, box_buff=0.2,
+            )),
+            # Example 2: Fast - more complex
+            ("example_2", self.run_example, dict(
+                title_text="Example 2: A More Complex Case",
+                houses=[2, 7, 9, 3, 1, 5, 8, 2, 4, 6], mode="fast", box_size=0.9, box_buff=0.12,
+            )),
+            ("show_code", self.show_code, {}),
+            ("end_screen", self.end_screen, {}),
+        ]
+
+    def tear_down(self):
+        caches = (SVG_CACHE, ICON_CACHE, CARD_CACHE, GLYPH_CACHE, TEXT_CACHE)
+        for cache in caches:
+            logger.info(cache.summary())
+
+        if self.profiler:
+            path = PROFILE
+            if path == "1":
+                movie = getattr(self.renderer.file_writer, "movie_file_path", None)
+                path = f"{os.path.splitext(movie)[0]}.profile.json" if movie else f"{type(self).__name__}.profile.json"
+            self.profiler.write(path, self, [cache.stats() for cache in caches])
+            logger.info(f"Render profile written to {path}")
 
     def create_icon(self, icon_name, size, color):
-        """Load and style an SVG icon."""
-        icon_path = os.path.join(ICON_DIR, f"{icon_name}.svg")
-        icon = SVGMobject(icon_path)
-        icon.set_fill(color, opacity=1)
-        icon.set_stroke(width=0)
-        icon.scale_to_fit_height(size)
-        return icon
+        """Load and style an SVG icon, parsing each file only once."""
+        def build():
+            icon = SVG_CACHE.get(icon_name, lambda: SVGMobject(os.path.join(ICON_DIR, f"{icon_name}.svg")))
+            icon.set_fill(color, opacity=1)
+            icon.set_stroke(width=0)
+            icon.scale_to_fit_height(size)
+            return icon
+
+        return ICON_CACHE.get((icon_name, size, color), build)
 
     def create_house_box(self, value, box_size, highlighted=False):
         """Create a house box with home icon in top-right corner."""
-        if highlighted:
-            fill_color = ACCENT_WARM
-            text_color = TEXT_DARK
-            icon_color = TEXT_DARK
-        else:
-            fill_color = CARD_LIGHT
-            text_color = TEXT_PRIMARY
-            icon_color = TEXT_SECONDARY
+        return self.create_card("house", "", value, box_size, highlighted)
 
-        box = RoundedRectangle(width=box_size, height=box_size, corner_radius=CORNER_RADIUS)
-        box.set_fill(fill_color, opacity=0.95)
-        box.set_stroke(width=0)
+    def create_person_box(self, label, value, box_size, highlighted=False):
+        """Create a person/robber box with person icon in top-right corner."""
+        return self.create_card("person", label, value, box_size, highlighted)
 
-        # Home icon in top-right
-        icon_size = box_size * 0.22
-        icon = self.create_icon("home", icon_size, icon_color)
-        icon.move_to(box.get_corner(UR) + LEFT * 0.15 + DOWN * 0.15)
+    def create_loot_box(self, label, value, box_size, highlighted=False):
+        """Create a loot/temp box with briefcase icon in top-right corner."""
+        return self.create_card("loot", label, value, box_size, highlighted)
 
-        # Value in center
-        font_size = 36 if box_size >= 1.0 else 26
-        value_text = Text(str(value), font=FONT, font_size=font_size, color=text_color)
-        value_text.move_to(box.get_center())
+    def create_card(self, kind, label, value, box_size, highlighted=False):
+        """Copy a built card from the cache, building it on first use.
 
-        return VGroup(box, icon, value_text)
+        The card remembers what it shows in ``card_state`` so update_card
+        can work out what changed.
+        """
+        state = (kind, label, str(value), box_size, highlighted)
 
-    def create_person_box(self, label, value, box_size, highlighted=False):
-        """Create a person/robber box with person icon in top-right corner."""
-        if highlighted:
-            fill_color = ACCENT_WARM
-            text_color = TEXT_DARK
-            icon_color = TEXT_DARK
+        def build():
+            if kind == "house":
+                card = self._build_house_box(value, box_size, highlighted)
+            else:
+                card = self._build_labelled_box(kind, label, value, box_size, highlighted)
+            card.card_state = state
+            return card
+
+        return CARD_CACHE.get(state, build)
+
+    def create_card_value(self, kind, value, box_size, color):
+        if kind == "house":
+            font_size = 36 if box_size >= 1.0 else 26
         else:
-            fill_color = CARD_BG
-            text_color = TEXT_PRIMARY
-            icon_color = TEXT_SECONDARY
+            font_size = 40 if box_size >= 1.0 else 28
+        return GLYPH_CACHE.text(value, FONT, font_size, color)
+
+    def update_card(self, card, value=None, highlighted=None):
+        """Animations that change a card's value and/or highlight in place.
+
+        Only what changes is animated: colours are interpolated on the
+        existing parts and a new value replaces just the value glyphs.
+        """
+        kind, label, old_value, box_size, was_highlighted = card.card_state
+        value = old_value if value is None else str(value)
+        highlighted = was_highlighted if highlighted is None else highlighted
+        if value == old_value and highlighted == was_highlighted:
+            return []
+
+        state = (kind, label, value, box_size, highlighted)
+        card.card_state = state
+        if not old_value or not value:
+            # The value text appears or disappears, so transform the whole card
+            return [DeferredTransform(card, lambda mob: self.create_card(*state).move_to(mob))]
+
+        fill_color, text_color, icon_color = CARD_STYLES[kind, highlighted]
+        box, icon, value_text = card[0], card[-2], card[-1]
+        anims = []
+        if highlighted != was_highlighted:
+            anims += [Recolor(box, fill_color), Recolor(icon, icon_color)]
+            if kind != "house":
+                anims.append(Recolor(card[1], text_color))
+
+        if value != old_value:
+            new_value = self.create_card_value(kind, value, box_size, text_color)
+            offset = CARD_VALUE_OFFSETS[kind]
+            anims.append(DeferredTransform(value_text, lambda mob: new_value.move_to(box.get_center() + offset)))
+        elif highlighted != was_highlighted:
+            anims.append(Recolor(value_text, text_color))
+        return anims
+
+    def _build_house_box(self, value, box_size, highlighted):
+        fill_color, text_color, icon_color = CARD_STYLES["house", highlighted]
 
         box = RoundedRectangle(width=box_size, height=box_size, corner_radius=CORNER_RADIUS)
         box.set_fill(fill_color, opacity=0.95)
         box.set_stroke(width=0)
 
-        # Label in top-left
-        label_size = 14 if box_size >= 1.0 else 10
-        label_text = Text(label, font=FONT, font_size=label_size, color=text_color, slant=ITALIC)
-        label_text.move_to(box.get_corner(UL) + RIGHT * 0.18 + DOWN * 0.15)
-
-        # Person icon in top-right
+        # Home icon in top-right
         icon_size = box_size * 0.22
-        icon = self.create_icon("person", icon_size, icon_color)
+        icon = self.create_icon("home", icon_size, icon_color)
         icon.move_to(box.get_corner(UR) + LEFT * 0.15 + DOWN * 0.15)
 
         # Value in center
-        if value:
-            font_size = 40 if box_size >= 1.0 else 28
-            value_text = Text(value, font=FONT, font_size=font_size, color=text_color)
-            value_text.move_to(box.get_center() + DOWN * 0.05)
-            return VGroup(box, label_text, icon, value_text)
+        value_text = self.create_card_value("house", str(value), box_size, text_color)
+        value_text.move_to(box.get_center() + CARD_VALUE_OFFSETS["house"])
 
-        return VGroup(box, label_text, icon)
+        return VGroup(box, icon, value_text)
 
-    def create_loot_box(self, label, value, box_size, highlighted=False):
-        """Create a loot/temp box with briefcase icon in top-right corner."""
-        if highlighted:
-            fill_color = ACCENT_WARM
-            text_color = TEXT_DARK
-            icon_color = TEXT_DARK
-        else:
-            fill_color = CARD_BG
-            text_color = TEXT_PRIMARY
-            icon_color = ACCENT_GREEN
+    def _build_labelled_box(self, kind, label, value, box_size, highlighted):
+        """Person (robber) and loot (temp) cards: label top-left, icon top-right."""
+        fill_color, text_color, icon_color = CARD_STYLES[kind, highlighted]
 
         box = RoundedRectangle(width=box_size, height=box_size, corner_radius=CORNER_RADIUS)
         box.set_fill(fill_color, opacity=0.95)
@@ -130,16 +525,15 @@ class HouseRobber(Scene):
         label_text = Text(label, font=FONT, font_size=label_size, color=text_color, slant=ITALIC)
         label_text.move_to(box.get_corner(UL) + RIGHT * 0.18 + DOWN * 0.15)
 
-        # Briefcase icon in top-right
+        # Person or briefcase icon in top-right
         icon_size = box_size * 0.22
-        icon = self.create_icon("briefcase", icon_size, icon_color)
+        icon = self.create_icon(CARD_ICONS[kind], icon_size, icon_color)
         icon.move_to(box.get_corner(UR) + LEFT * 0.15 + DOWN * 0.15)
 
         # Value in center
         if value:
-            font_size = 40 if box_size >= 1.0 else 28
-            value_text = Text(value, font=FONT, font_size=font_size, color=text_color)
-            value_text.move_to(box.get_center() + DOWN * 0.05)
+            value_text = self.create_card_value(kind, value, box_size, text_color)
+            value_text.move_to(box.get_center() + CARD_VALUE_OFFSETS[kind])
             return VGroup(box, label_text, icon, value_text)
 
         return VGroup(box, label_text, icon)
@@ -153,7 +547,7 @@ class HouseRobber(Scene):
         # Index labels
         indices = VGroup()
         for i, box in enumerate(array_boxes):
-            idx = Text(str(i), font=FONT_MONO, font_size=12, color=TEXT_SECONDARY)
+            idx = GLYPH_CACHE.text(str(i), FONT_MONO, 12, TEXT_SECONDARY)
             idx.next_to(box, DOWN, buff=0.1)
             indices.add(idx)
 
@@ -186,27 +580,20 @@ class HouseRobber(Scene):
         new_explain = self.create_text_box("Initialize: no houses\nrobbed yet, so all zero", width=4.5, height=1.2)
         new_explain.move_to(explain_box.get_center())
 
-        new_t = self.create_loot_box("t", "0", box_size, highlighted=True)
-        new_r1 = self.create_person_box("r1", "0", box_size, highlighted=True)
-        new_r2 = self.create_person_box("r2", "0", box_size, highlighted=True)
-        new_t.move_to(t_box.get_center())
-        new_r1.move_to(r1_box.get_center())
-        new_r2.move_to(r2_box.get_center())
-
         self.play(
             Transform(explain_box, new_explain),
-            Transform(t_box, new_t),
-            Transform(r1_box, new_r1),
-            Transform(r2_box, new_r2),
+            *self.update_card(t_box, value=0),
+            *self.update_card(r1_box, value=0),
+            *self.update_card(r2_box, value=0),
             run_time=0.6
         )
         self.wait(1)
         self.play(FadeOut(explain_box), run_time=0.3)
 
         # Main loop
-        r1, r2 = 0, 0
+        best = 0
 
-        for i, house_val in enumerate(houses):
+        for i, house_val, r1, r2, t, is_rob in dp_trace(houses):
             current_x = array_boxes[i].get_center()[0]
             base_y = array_boxes[i].get_center()[1]
 
@@ -214,7 +601,9 @@ class HouseRobber(Scene):
             r1_target = [current_x - (box_size + box_buff), base_y + (box_size + box_buff), 0]
             r2_target = [current_x, base_y + (box_size + box_buff), 0]
 
-            self.play(
+            # Each iteration is one plan: a play call between each pair of waits
+            plan = AnimationPlan()
+            plan.play(
                 t_box.animate.move_to(t_target),
                 r1_box.animate.move_to(r1_target),
                 r2_box.animate.move_to(r2_target),
@@ -222,17 +611,10 @@ class HouseRobber(Scene):
             )
 
             # Highlight r1
-            new_r1_hl = self.create_person_box("r1", str(r1), box_size, highlighted=True)
-            new_r1_hl.move_to(r1_box.get_center())
-            new_r2_dim = self.create_person_box("r2", str(r2), box_size, highlighted=False)
-            new_r2_dim.move_to(r2_box.get_center())
-            new_t_dim = self.create_loot_box("t", str(r2 if i > 0 else 0), box_size, highlighted=False)
-            new_t_dim.move_to(t_box.get_center())
-
-            self.play(
-                Transform(r1_box, new_r1_hl),
-                Transform(r2_box, new_r2_dim),
-                Transform(t_box, new_t_dim),
+            plan.play(
+                *self.update_card(r1_box, value=r1, highlighted=True),
+                *self.update_card(r2_box, value=r2, highlighted=False),
+                *self.update_card(t_box, value=r2 if i > 0 else 0, highlighted=False),
                 run_time=0.3
             )
 
@@ -242,9 +624,9 @@ class HouseRobber(Scene):
                 width=4.5, height=0.9
             )
             question_box.to_corner(UL, buff=0.5)
-            self.play(FadeIn(question_box), run_time=0.4)
-            self.wait(0.5)
-            self.play(FadeOut(question_box), run_time=0.3)
+            plan.play(plan.reveal(question_box), run_time=0.4)
+            plan.wait(0.5)
+            plan.play(FadeOut(question_box), run_time=0.3)
 
             # Plus sign
             plus_sign = Text("+", font=FONT, font_size=36, color=ACCENT_WARM)
@@ -255,20 +637,15 @@ class HouseRobber(Scene):
             ])
 
             # Highlight house
-            highlighted_house = self.create_house_box(house_val, box_size, highlighted=True)
-            highlighted_house.move_to(array_boxes[i].get_center())
-
-            self.play(
-                FadeIn(plus_sign),
-                Transform(array_boxes[i], highlighted_house),
+            plan.play(
+                plan.reveal(plus_sign),
+                *self.update_card(array_boxes[i], highlighted=True),
                 run_time=0.3
             )
-            self.wait(0.3)
+            plan.wait(0.3)
 
             # Calculate
             r1_plus_val = r1 + house_val
-            t = max(r1_plus_val, r2)
-            is_rob = r1_plus_val >= r2
 
             if is_rob:
                 explanation = f"{r1}+{house_val}={r1_plus_val} ≥ {r2}"
@@ -277,89 +654,63 @@ class HouseRobber(Scene):
                 explanation = f"{r2} > {r1}+{house_val}={r1_plus_val} SKIP!"
                 exp_color = ACCENT_RED
 
-            calc_text = Text(explanation, font=FONT_MONO, font_size=20, color=exp_color)
+            calc_text = GLYPH_CACHE.text(explanation, FONT_MONO, 20, exp_color)
             calc_text.to_corner(UL, buff=0.5)
 
-            new_t = self.create_loot_box("t", str(t), box_size, highlighted=True)
-            new_t.move_to(t_box.get_center())
-
-            self.play(
-                FadeIn(calc_text),
-                Transform(t_box, new_t),
+            plan.play(
+                plan.reveal(calc_text),
+                *self.update_card(t_box, value=t, highlighted=True),
                 run_time=0.5
             )
-            self.wait(0.8)
+            plan.wait(0.8)
 
             # Reset house
-            reset_house = self.create_house_box(house_val, box_size, highlighted=False)
-            reset_house.move_to(array_boxes[i].get_center())
-
-            self.play(
+            plan.play(
                 FadeOut(plus_sign),
                 FadeOut(calc_text),
-                Transform(array_boxes[i], reset_house),
+                *self.update_card(array_boxes[i], highlighted=False),
                 run_time=0.3
             )
 
             # Shift
             shift_explain = self.create_text_box("Shift values forward", width=3.5, height=0.9)
             shift_explain.to_corner(UL, buff=0.5)
-            self.play(FadeIn(shift_explain), run_time=0.3)
-
-            new_r1_hl = self.create_person_box("r1", str(r2), box_size, highlighted=True)
-            new_r1_hl.move_to(r1_box.get_center())
-            self.play(Transform(r1_box, new_r1_hl), run_time=0.4)
-
-            new_r1_dim = self.create_person_box("r1", str(r2), box_size, highlighted=False)
-            new_r1_dim.move_to(r1_box.get_center())
-            self.play(Transform(r1_box, new_r1_dim), run_time=0.2)
-
-            new_r2_hl = self.create_person_box("r2", str(t), box_size, highlighted=True)
-            new_r2_hl.move_to(r2_box.get_center())
-            self.play(Transform(r2_box, new_r2_hl), run_time=0.4)
-
-            new_r2_dim = self.create_person_box("r2", str(t), box_size, highlighted=False)
-            new_r2_dim.move_to(r2_box.get_center())
-            self.play(Transform(r2_box, new_r2_dim), run_time=0.2)
-
-            final_t = self.create_loot_box("t", str(t), box_size, highlighted=False)
-            final_t.move_to(t_box.get_center())
-            self.play(
-                Transform(t_box, final_t),
+            plan.play(plan.reveal(shift_explain), run_time=0.3)
+
+            plan.play(*self.update_card(r1_box, value=r2, highlighted=True), run_time=0.4)
+            plan.play(*self.update_card(r1_box, highlighted=False), run_time=0.2)
+            plan.play(*self.update_card(r2_box, value=t, highlighted=True), run_time=0.4)
+            plan.play(*self.update_card(r2_box, highlighted=False), run_time=0.2)
+            plan.play(
+                *self.update_card(t_box, highlighted=False),
                 FadeOut(shift_explain),
                 run_time=0.3
             )
 
-            r1 = r2
-            r2 = t
-            self.wait(0.3)
+            best = t
+            plan.wait(0.3)
+            plan.run(self)
 
         # Final
-        final_t_hl = self.create_loot_box("t", str(r2), box_size, highlighted=True)
-        final_t_hl.move_to(t_box.get_center())
-        self.play(Transform(t_box, final_t_hl), run_time=0.5)
+        self.play(*self.update_card(t_box, value=best, highlighted=True), run_time=0.5)
 
-        result_text = self.create_text_box(f"Maximum: ${r2}", width=2.8, height=0.9)
+        result_text = self.create_text_box(f"Maximum: ${best}", width=2.8, height=0.9)
         result_text.next_to(t_box, UP, buff=0.3)
         self.play(FadeIn(result_text), run_time=0.5)
         self.wait(1.5)
 
         self.play(*[FadeOut(mob) for mob in self.mobjects], run_time=0.5)
 
-    def run_example_fast(self, houses, box_size, box_buff):
-        """Run the DP animation fast."""
-        array_boxes = [self.create_house_box(val, box_size) for val in houses]
-        array_group = VGroup(*array_boxes).arrange(RIGHT, buff=box_buff)
-        array_group.to_edge(DOWN, buff=1.2)
+    def run_example_fast(self, houses, box_size, box_buff, budget=None):
+        """Run the DP animation fast, scrolling the row if it doesn't fit on screen.
 
-        # Index labels
-        indices = VGroup()
-        for i, box in enumerate(array_boxes):
-            idx = Text(str(i), font=FONT_MONO, font_size=12, color=TEXT_SECONDARY)
-            idx.next_to(box, DOWN, buff=0.1)
-            indices.add(idx)
+        With a ``budget`` in seconds, iterations that don't fit are batched
+        into sweeps (see ``pace``), keeping the first and last few detailed.
+        """
+        row = HouseViewport(self, houses, box_size, box_buff, bottom_buff=1.2)
+        step = box_size + box_buff
 
-        self.play(*[FadeIn(box) for box in array_boxes], FadeIn(indices), run_time=0.6)
+        self.play(FadeIn(row.row), run_time=0.6)
         self.wait(0.2)
 
         explain = self.create_text_box("Same approach!", width=3, height=0.8)
@@ -369,96 +720,151 @@ class HouseRobber(Scene):
         r1_box = self.create_person_box("r1", "0", box_size, highlighted=False)
         r2_box = self.create_person_box("r2", "0", box_size, highlighted=False)
 
-        first_box_x = array_boxes[0].get_center()[0]
-        base_y = array_boxes[0].get_center()[1]
-        t_box.move_to([first_box_x + (box_size + box_buff), base_y + (box_size + box_buff) * 2, 0])
-        r1_box.move_to([first_box_x, base_y + (box_size + box_buff), 0])
-        r2_box.move_to([first_box_x + (box_size + box_buff), base_y + (box_size + box_buff), 0])
+        first_box_x = row.x(0)
+        t_box.move_to([first_box_x + step, row.y + step * 2, 0])
+        r1_box.move_to([first_box_x, row.y + step, 0])
+        r2_box.move_to([first_box_x + step, row.y + step, 0])
 
         self.play(FadeIn(explain), FadeIn(t_box), FadeIn(r1_box), FadeIn(r2_box), run_time=0.5)
         self.wait(0.6)
         self.play(FadeOut(explain), run_time=0.2)
 
-        r1, r2 = 0, 0
-
-        for i, house_val in enumerate(houses):
-            current_x = array_boxes[i].get_center()[0]
-            base_y = array_boxes[i].get_center()[1]
-
-            t_target = [current_x, base_y + (box_size + box_buff) * 2, 0]
-            r1_target = [current_x - (box_size + box_buff), base_y + (box_size + box_buff), 0]
-            r2_target = [current_x, base_y + (box_size + box_buff), 0]
-
-            self.play(
-                t_box.animate.move_to(t_target),
-                r1_box.animate.move_to(r1_target),
-                r2_box.animate.move_to(r2_target),
-                run_time=0.25
-            )
-
-            highlighted_house = self.create_house_box(house_val, box_size, highlighted=True)
-            highlighted_house.move_to(array_boxes[i].get_center())
-            self.play(Transform(array_boxes[i], highlighted_house), run_time=0.15)
-
-            r1_plus_val = r1 + house_val
-            t = max(r1_plus_val, r2)
-            is_rob = r1_plus_val >= r2
-
-            if is_rob:
-                explanation = f"{r1}+{house_val}={r1_plus_val} ≥ {r2}"
-                exp_color = ACCENT_GREEN
+        # The trace is consumed as it is animated, never held as a whole
+        trace = dp_trace(houses)
+        cards = (t_box, r1_box, r2_box)
+        best = 0
+        for start, stop, detailed in pace(len(houses), budget, FAST_STEP_SECONDS, FAST_SWEEP_SECONDS):
+            if detailed:
+                best = self.fast_step(row, cards, next(trace))
             else:
-                explanation = f"{r2} > {r1}+{house_val}={r1_plus_val} SKIP!"
-                exp_color = ACCENT_RED
-
-            calc_text = Text(explanation, font=FONT_MONO, font_size=16, color=exp_color)
-            calc_text.to_corner(UL, buff=0.4)
+                best = self.fast_sweep(row, cards, islice(trace, stop - start))
 
-            new_t = self.create_loot_box("t", str(t), box_size, highlighted=True)
-            new_t.move_to(t_box.get_center())
+        self.play(*self.update_card(t_box, value=best, highlighted=True), run_time=0.3)
 
-            self.play(FadeIn(calc_text), Transform(t_box, new_t), run_time=0.25)
-
-            if not is_rob:
-                self.wait(0.5)
-            else:
-                self.wait(0.2)
+        result_text = self.create_text_box(f"Maximum: ${best}", width=2.5, height=0.8)
+        result_text.next_to(t_box, UP, buff=0.3)
+        self.play(FadeIn(result_text), run_time=0.3)
+        self.wait(1.5)
 
-            reset_house = self.create_house_box(house_val, box_size, highlighted=False)
-            reset_house.move_to(array_boxes[i].get_center())
-            self.play(FadeOut(calc_text), Transform(array_boxes[i], reset_house), run_time=0.15)
+        self.play(*[FadeOut(mob) for mob in self.mobjects], run_time=0.4)
 
-            new_r1 = self.create_person_box("r1", str(r2), box_size, highlighted=True)
-            new_r1.move_to(r1_box.get_center())
-            self.play(Transform(r1_box, new_r1), run_time=0.15)
+    def fast_step(self, row, cards, dp_step):
+        """One DP iteration in full detail, as a single plan; returns its t."""
+        t_box, r1_box, r2_box = cards
+        i, house_val, r1, r2, t, is_rob = dp_step
+        step = row.step
+        scroll = row.scroll_to(i)
+        current_x = row.x(i)
+
+        t_target = [current_x, row.y + step * 2, 0]
+        r1_target = [current_x - step, row.y + step, 0]
+        r2_target = [current_x, row.y + step, 0]
+
+        # Each iteration is one plan: a play call either side of its wait
+        plan = AnimationPlan()
+        plan.play(
+            *scroll,
+            t_box.animate.move_to(t_target),
+            r1_box.animate.move_to(r1_target),
+            r2_box.animate.move_to(r2_target),
+            run_time=0.25
+        )
 
-            new_r1_dim = self.create_person_box("r1", str(r2), box_size, highlighted=False)
-            new_r1_dim.move_to(r1_box.get_center())
+        plan.play(*row.restyle(i, highlighted=True), run_time=0.15)
 
-            new_r2 = self.create_person_box("r2", str(t), box_size, highlighted=True)
-            new_r2.move_to(r2_box.get_center())
-            self.play(Transform(r1_box, new_r1_dim), Transform(r2_box, new_r2), run_time=0.15)
+        r1_plus_val = r1 + house_val
 
-            new_r2_dim = self.create_person_box("r2", str(t), box_size, highlighted=False)
-            new_r2_dim.move_to(r2_box.get_center())
+        if is_rob:
+            explanation = f"{r1}+{house_val}={r1_plus_val} ≥ {r2}"
+            exp_color = ACCENT_GREEN
+        else:
+            explanation = f"{r2} > {r1}+{house_val}={r1_plus_val} SKIP!"
+            exp_color = ACCENT_RED
 
-            final_t = self.create_loot_box("t", str(t), box_size, highlighted=False)
-            final_t.move_to(t_box.get_center())
-            self.play(Transform(t_box, final_t), Transform(r2_box, new_r2_dim), run_time=0.15)
+        calc_text = GLYPH_CACHE.text(explanation, FONT_MONO, 16, exp_color)
+        calc_text.to_corner(UL, buff=0.4)
 
-            r1 = r2
-            r2 = t
+        plan.play(plan.reveal(calc_text), *self.update_card(t_box, value=t, highlighted=True), run_time=0.25)
 
-        final_t_hl = self.create_loot_box("t", str(r2), box_size, highlighted=True)
-        final_t_hl.move_to(t_box.get_center())
-        self.play(Transform(t_box, final_t_hl), run_time=0.3)
+        if not is_rob:
+            plan.wait(0.5)
+        else:
+            plan.wait(0.2)
+
+        plan.play(FadeOut(calc_text), *row.restyle(i, highlighted=False), run_time=0.15)
+        plan.play(*self.update_card(r1_box, value=r2, highlighted=True), run_time=0.15)
+        plan.play(
+            *self.update_card(r1_box, highlighted=False),
+            *self.update_card(r2_box, value=t, highlighted=True),
+            run_time=0.15
+        )
+        plan.play(
+            *self.update_card(t_box, highlighted=False),
+            *self.update_card(r2_box, highlighted=False),
+            run_time=0.15
+        )
 
-        result_text = self.create_text_box(f"Maximum: ${r2}", width=2.5, height=0.8)
-        result_text.next_to(t_box, UP, buff=0.3)
-        self.play(FadeIn(result_text), run_time=0.3)
-        self.wait(1.5)
+        plan.run(self)
+        return t
+
+    def fast_sweep(self, row, cards, dp_steps):
+        """Several DP iterations summed up in one short sweep.
+
+        The row jumps to the last house of the batch, the visible houses of
+        the batch light up in a wave, and r1/r2/t go straight to their
+        values after the batch. Skipped houses keep a red index label.
+        ``dp_steps`` is consumed once, keeping only the steps that can be on
+        screen. Returns t after the batch.
+        """
+        t_box, r1_box, r2_box = cards
+        step = row.step
+        # Only the tail of a batch can still be on screen once the row has scrolled to its end
+        tail = deque(maxlen=row.size)
+        count = skipped = 0
+        for s in dp_steps:
+            tail.append(s)
+            count += 1
+            skipped += not s.is_rob
+        last = tail[-1]
+        scroll = row.scroll_to(last.index)
+        current_x = row.x(last.index)
+        visible = [s for s in tail if row.shows(s.index)]
+
+        plan = AnimationPlan()
+        plan.play(
+            *scroll,
+            t_box.animate.move_to([current_x, row.y + step * 2, 0]),
+            r1_box.animate.move_to([current_x - step, row.y + step, 0]),
+            r2_box.animate.move_to([current_x, row.y + step, 0]),
+            run_time=0.3
+        )
 
-        self.play(*[FadeOut(mob) for mob in self.mobjects], run_time=0.4)
+        summary = GLYPH_CACHE.text(
+            f"{last.index - count + 1}-{last.index} +{count - skipped} SKIP {skipped}",
+            FONT_MONO, 16, ACCENT_WARM,
+        )
+        summary.to_corner(UL, buff=0.4)
+        wave = [AnimationGroup(*row.restyle(s.index, highlighted=True)) for s in visible]
+        plan.play(
+            plan.reveal(summary),
+            *([AnimationGroup(*wave, lag_ratio=0.15)] if wave else []),
+            *self.update_card(t_box, value=last.t, highlighted=True),
+            *self.update_card(r1_box, value=last.r2, highlighted=True),
+            *self.update_card(r2_box, value=last.t, highlighted=True),
+            run_time=0.5
+        )
+        plan.wait(0.2)
+
+        plan.play(
+            FadeOut(summary),
+            *[anim for s in visible for anim in row.restyle(s.index, highlighted=False, flagged=not s.is_rob)],
+            *self.update_card(t_box, highlighted=False),
+            *self.update_card(r1_box, highlighted=False),
+            *self.update_card(r2_box, highlighted=False),
+            run_time=0.2
+        )
+        plan.run(self)
+        return last.t
 
     def title_screen(self):
         author = Text("By Jon Taylor", font=FONT, font_size=20, color=TEXT_SECONDARY)
@@ -510,6 +916,14 @@ triggering any alarms."""
             run_time=0.5
         )
 
+    def run_example(self, title_text, houses, mode, box_size, box_buff, budget=None):
+        validate_houses(houses)
+        self.example_header(title_text)
+        if mode == "slow":
+            self.run_example_slow(houses, box_size=box_size, box_buff=box_buff)
+        else:
+            self.run_example_fast(houses, box_size=box_size, box_buff=box_buff, budget=budget)
+
     def example_header(self, title_text):
         header = Text(title_text, font=FONT, font_size=28, color=ACCENT)
         header.move_to(ORIGIN)
@@ -522,14 +936,21 @@ triggering any alarms."""
         box.set_fill(CARD_BG, opacity=0.95)
         box.set_stroke(width=0)
 
-        text = Text(text_content, font=FONT, font_size=18, color=TEXT_PRIMARY, line_spacing=0.8)
+        text = self.create_fitted_text(text_content, FONT, 18, 0.8, width - 0.3)
         text.move_to(box.get_center())
 
-        if text.width > width - 0.3:
-            text.scale((width - 0.3) / text.width)
-
         return VGroup(box, text)
 
+    def create_fitted_text(self, text_content, font, font_size, line_spacing, max_width):
+        """Text scaled down to ``max_width`` if needed, laid out by Pango only once."""
+        def build():
+            text = Text(text_content, font=font, font_size=font_size, color=TEXT_PRIMARY, line_spacing=line_spacing)
+            if text.width > max_width:
+                text.scale(max_width / text.width)
+            return text
+
+        return TEXT_CACHE.get((text_content, font, font_size, line_spacing, max_width), build)
+
     def show_code(self):
         code_label = self.create_text_box("C#", width=1.2, height=0.8)
         code_label.to_corner(UL, buff=0.5)
@@ -574,3 +995,16 @@ triggering any alarms."""
 
         self.play(FadeIn(author), FadeIn(github), FadeIn(thanks), run_time=0.5)
         self.wait(2)
+
+
+def example_scene(houses, mode="fast", box_size=0.9, box_buff=0.12, title_text="Example", budget=None):
+    """A HouseRobber scene class that renders a single worked example."""
+
+    class HouseRobberExample(HouseRobber):
+        def sections(self):
+            return [("example", self.run_example, dict(
+                title_text=title_text, houses=houses, mode=mode, box_size=box_size, box_buff=box_buff,
+                budget=budget,
+            ))]
+
+    return HouseRobberExample
@@ -0,0 +1,150 @@
+"""Dry-run a HouseRobber render: timeline JSON and keyframe thumbnails, no video.
+
+    python storyboard.py -o storyboard.json
+    python storyboard.py --houses 2,7,9,3,1 --keyframes 0,5,12.5 --thumbnails thumbs/
+
+construct() runs with animations skipped, so every play jumps straight to
+its end state and nothing is encoded. Nothing is rasterised either, except
+the thumbnails: a thumbnail for time t shows the end state of the play that
+is running at t. Keyframes after the end of the video get no thumbnail and a
+warning.
+"""
+import argparse
+import json
+import os
+import time
+
+from manim import logger, tempconfig
+
+from dp import dp_trace
+from scene import HouseRobber, example_scene
+
+
+def describe(animation):
+    """Animation class names, nesting into groups and successions."""
+    parts = getattr(animation, "animations", None)
+    if parts is None:
+        return type(animation).__name__
+    return {type(animation).__name__: [describe(part) for part in parts]}
+
+
+def storyboard_scene(scene_cls, keyframes=(), thumbnail_dir=None):
+    """Subclass of ``scene_cls`` that records a timeline instead of frames."""
+
+    class Storyboard(scene_cls):
+        # Holds must keep their real length in the timeline
+        elide_holds = False
+
+        def setup(self):
+            super().setup()
+            self.clock = 0.0
+            self.sections_log = []
+            self.plays_log = []
+            self.thumbnails = []
+            self.pending_keyframes = sorted(keyframes)
+            # Otherwise play_internal still draws the moving mobjects of every skipped play
+            self.skip_animation_preview = True
+
+        def get_moving_and_static_mobjects(self, animations):
+            # A skipped play still rasterises its static layer; with none, nothing is drawn
+            return [], []
+
+        def is_current_animation_frozen_frame(self):
+            # A frozen wait draws the whole scene once, even while skipping
+            return False
+
+        def next_section(self, name="unnamed", *args, **kwargs):
+            super().next_section(name, *args, **kwargs)
+            self.sections_log.append({"name": name, "start": round(self.clock, 4), "first_play": len(self.plays_log)})
+
+        def play(self, *args, **kwargs):
+            super().play(*args, **kwargs)
+            run_time = self.duration
+            self.plays_log.append({
+                "index": len(self.plays_log),
+                "start": round(self.clock, 4),
+                "run_time": round(run_time, 4),
+                "animations": [describe(anim) for anim in self.animations],
+            })
+            self.clock += run_time
+            while self.pending_keyframes and self.pending_keyframes[0] <= self.clock:
+                self.save_thumbnail(self.pending_keyframes.pop(0))
+
+        def save_thumbnail(self, at):
+            if thumbnail_dir is None:
+                return
+            os.makedirs(thumbnail_dir, exist_ok=True)
+            path = os.path.join(thumbnail_dir, f"keyframe_{at:08.3f}s.png")
+            # Draw everything from scratch, not over the last play's static layer
+            self.renderer.static_image = None
+            self.renderer.update_frame(self)
+            self.renderer.get_image().save(path)
+            self.thumbnails.append({"time": at, "path": path})
+
+        def timeline(self):
+            section_args = {name: kwargs for name, _, kwargs in self.sections()}
+            sections = []
+            for i, section in enumerate(self.sections_log):
+                end = self.sections_log[i + 1]["start"] if i + 1 < len(self.sections_log) else self.clock
+                last_play = self.sections_log[i + 1]["first_play"] if i + 1 < len(self.sections_log) else len(self.plays_log)
+                entry = dict(section, duration=round(end - section["start"], 4), plays=last_play - section["first_play"])
+                houses = section_args.get(section["name"], {}).get("houses")
+                if houses is not None:
+                    entry["dp_steps"] = [step._asdict() for step in dp_trace(houses)]
+                sections.append(entry)
+            return {
+                "scene": scene_cls.__name__,
+                "duration": round(self.clock, 4),
+                "play_count": len(self.plays_log),
+                "sections": sections,
+                "plays": self.plays_log,
+                "thumbnails": self.thumbnails,
+            }
+
+    return Storyboard
+
+
+def dry_run(scene_cls, keyframes=(), thumbnail_dir=None):
+    """Run ``scene_cls`` without rendering and return its timeline."""
+    with tempconfig({
+        "quality": "low_quality",
+        "write_to_movie": False,
+        "disable_caching": True,
+        "verbosity": "WARNING",
+    }):
+        scene = storyboard_scene(scene_cls, keyframes, thumbnail_dir)(skip_animations=True)
+        scene.render()
+    if scene.pending_keyframes:
+        missed = ", ".join(f"{at:g}s" for at in scene.pending_keyframes)
+        logger.warning(f"Keyframes after the end of the video ({scene.clock:.2f}s) were skipped: {missed}")
+    return scene.timeline()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--houses", help="comma-separated values; storyboard just this example")
+    parser.add_argument("--mode", choices=["slow", "fast"], default="fast")
+    parser.add_argument("--budget", type=float, default=None, help="seconds for the DP loop (fast mode)")
+    parser.add_argument("--keyframes", default="", help="comma-separated times in seconds")
+    parser.add_argument("--thumbnails", default=None, help="directory for keyframe PNGs")
+    parser.add_argument("-o", "--output", default="storyboard.json")
+    args = parser.parse_args()
+
+    if args.houses:
+        scene_cls = example_scene([int(v) for v in args.houses.split(",")], mode=args.mode, budget=args.budget)
+    else:
+        scene_cls = HouseRobber
+    keyframes = [float(t) for t in args.keyframes.split(",") if t]
+
+    start = time.perf_counter()
+    timeline = dry_run(scene_cls, keyframes, args.thumbnails)
+    with open(args.output, "w") as f:
+        json.dump(timeline, f, indent=2)
+    print(
+        f"{timeline['duration']:.1f}s of video in {timeline['play_count']} plays "
+        f"(dry run took {time.perf_counter() - start:.1f}s) -> {args.output}"
+    )
+
+
+if __name__ == "__main__":
+    main()
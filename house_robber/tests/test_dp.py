@@ -0,0 +1,103 @@
+from itertools import combinations
+
+import pytest
+
+from dp import dp_trace, pace, validate_houses
+
+STEP, SWEEP = 1.6, 1.2
+
+
+def brute_force(houses):
+    """Best loot over every set of houses with no two adjacent."""
+    best = 0
+    for k in range(len(houses) + 1):
+        for chosen in combinations(range(len(houses)), k):
+            if all(b - a > 1 for a, b in zip(chosen, chosen[1:])):
+                best = max(best, sum(houses[i] for i in chosen))
+    return best
+
+
+@pytest.mark.parametrize("houses", [[1, 2, 3, 1], [2, 7, 9, 3, 1], [2, 1, 1, 2], [5], [0, 0, 0], [4, 1, 2, 7, 5, 3, 1]])
+def test_dp_trace_finds_the_best_loot(houses):
+    steps = list(dp_trace(houses))
+    assert [s.index for s in steps] == list(range(len(houses)))
+    assert [s.value for s in steps] == houses
+    assert steps[-1].t == brute_force(houses)
+
+
+def test_dp_trace_shifts_r1_and_r2():
+    steps = list(dp_trace([2, 7, 9, 3, 1, 5, 8, 2, 4, 6]))
+    assert (steps[0].r1, steps[0].r2) == (0, 0)
+    for before, after in zip(steps, steps[1:]):
+        assert (after.r1, after.r2) == (before.r2, before.t)
+    for s in steps:
+        assert s.t == max(s.r1 + s.value, s.r2)
+        assert s.is_rob == (s.r1 + s.value >= s.r2)
+
+
+def test_dp_trace_is_lazy():
+    def houses():
+        yield 3
+        raise AssertionError("read past the first house")
+
+    assert next(dp_trace(houses())).t == 3
+
+
+def test_dp_trace_of_no_houses():
+    assert list(dp_trace([])) == []
+
+
+@pytest.mark.parametrize("houses", [[1, -2], [1, 2.5], [True], ["3"]])
+def test_validate_houses_rejects(houses):
+    with pytest.raises(ValueError):
+        validate_houses(houses)
+
+
+def check_ranges(ranges, n):
+    """Ranges are non-empty, in order and cover 0..n exactly."""
+    assert ranges[0][0] == 0 and ranges[-1][1] == n
+    for (start, stop, _), (next_start, _, _) in zip(ranges, ranges[1:]):
+        assert stop == next_start
+    assert all(stop > start for start, stop, _ in ranges)
+    assert all(stop == start + 1 for start, stop, detailed in ranges if detailed)
+
+
+def video_seconds(ranges):
+    return sum(STEP if detailed else SWEEP for _, _, detailed in ranges)
+
+
+@pytest.mark.parametrize("budget", [None, 16, 1000])
+def test_pace_keeps_every_step_when_it_fits(budget):
+    assert pace(10, budget, STEP, SWEEP) == [(i, i + 1, True) for i in range(10)]
+
+
+def test_pace_of_no_iterations():
+    assert pace(0, 5, STEP, SWEEP) == []
+
+
+def test_pace_batches_the_middle():
+    ranges = pace(100, 30, STEP, SWEEP)
+    check_ranges(ranges, 100)
+    assert [r[2] for r in ranges[:3] + ranges[-3:]] == [True] * 6
+    assert not any(detailed for _, _, detailed in ranges[3:-3])
+    assert video_seconds(ranges) <= 30
+
+
+def test_pace_shrinks_the_edges_to_fit():
+    ranges = pace(50, 2 * STEP + SWEEP, STEP, SWEEP)
+    assert ranges == [(0, 1, True), (1, 49, False), (49, 50, True)]
+
+
+@pytest.mark.parametrize("n", [1, 2])
+def test_pace_keeps_a_detailed_step_over_budget(n):
+    assert pace(n, 0.1, STEP, SWEEP) == [(i, i + 1, True) for i in range(n)]
+
+
+@pytest.mark.parametrize("n", [3, 4, 7, 10, 99, 1000, 10000])
+@pytest.mark.parametrize("budget", [0.1, 5, 12, 60, 600])
+def test_pace_covers_every_iteration(n, budget):
+    ranges = pace(n, budget, STEP, SWEEP)
+    check_ranges(ranges, n)
+    assert ranges[0][2] and ranges[-1][2]
+    if budget >= 2 * STEP + SWEEP:
+        assert video_seconds(ranges) <= budget + 1e-9
@@ -0,0 +1,43 @@
+import sys
+import textwrap
+
+import pytest
+
+from render_batch import read_jobs, run_jobs
+
+STUB_JOBS = """
+import os
+
+def warm_up():
+    pass
+
+def render_job(job):
+    if job.get("crash"):
+        os._exit(1)
+    return {"id": job["id"], "output": job["output"], "ok": True, "seconds": 0.0}
+"""
+
+
+@pytest.fixture
+def stub_jobs(tmp_path, monkeypatch):
+    """A ``jobs`` module that renders nothing, so workers run without manim."""
+    (tmp_path / "jobs.py").write_text(textwrap.dedent(STUB_JOBS))
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, "jobs", raising=False)
+
+
+def test_read_jobs_logs_bad_lines(tmp_path):
+    path = tmp_path / "jobs.jsonl"
+    path.write_text('{"id": "a", "houses": [1]}\nnot json\n[1, 2]\n\n{"houses": [2]}\n')
+    jobs, bad = read_jobs(str(path), "out")
+    assert [(job["id"], job["output"]) for job in jobs] == [("a", "out/a.mp4"), (5, "out/5.mp4")]
+    assert [result["id"] for result in bad] == [2, 3]
+    assert not any(result["ok"] for result in bad)
+
+
+def test_run_jobs_fails_only_the_job_that_kills_its_worker(stub_jobs):
+    jobs = [{"id": i, "output": f"{i}.mp4", "crash": i == 3} for i in range(8)]
+    results = {result["id"]: result for result in run_jobs(jobs, workers=2)}
+    assert sorted(results) == list(range(8))
+    assert [i for i, result in results.items() if not result["ok"]] == [3]
+    assert "BrokenProcessPool" in results[3]["error"]
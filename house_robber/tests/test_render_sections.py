@@ -0,0 +1,50 @@
+import os
+
+from render_sections import SectionCache
+
+
+def add_movie(cache, key, size, mtime):
+    path = os.path.join(cache.path, f"{key}.mp4")
+    with open(path, "wb") as f:
+        f.write(b"\0" * size)
+    os.utime(path, (mtime, mtime))
+
+
+def cached_keys(cache):
+    return sorted(name[:-4] for name in os.listdir(cache.path))
+
+
+def test_evict_drops_least_recently_used(tmp_path):
+    cache = SectionCache(str(tmp_path), max_bytes=250)
+    for age, key in enumerate(["new", "mid", "old"]):
+        add_movie(cache, key, 100, 1_000_000 - age)
+    cache.evict()
+    assert cached_keys(cache) == ["mid", "new"]
+
+
+def test_evict_keeps_everything_under_the_limit(tmp_path):
+    cache = SectionCache(str(tmp_path), max_bytes=300)
+    for age, key in enumerate(["a", "b", "c"]):
+        add_movie(cache, key, 100, 1_000_000 - age)
+    cache.evict()
+    assert cached_keys(cache) == ["a", "b", "c"]
+
+
+def test_get_marks_a_movie_as_used(tmp_path):
+    cache = SectionCache(str(tmp_path), max_bytes=150)
+    add_movie(cache, "old", 100, 1_000_000)
+    add_movie(cache, "new", 100, 1_000_001)
+    assert cache.get("old") is not None
+    cache.evict()
+    assert cached_keys(cache) == ["old"]
+
+
+def test_put_then_get(tmp_path):
+    movie = tmp_path / "movie.mp4"
+    movie.write_bytes(b"movie")
+    cache = SectionCache(str(tmp_path / "cache"), max_bytes=1000)
+    assert cache.get("key") is None
+    path = cache.put("key", str(movie))
+    assert cache.get("key") == path
+    with open(path, "rb") as f:
+        assert f.read() == b"movie"
@@ -0,0 +1,60 @@
+import pytest
+
+from render_shards import plan_shards, shard_scene
+
+
+def timeline(run_times):
+    return {"plays": [{"index": i, "run_time": t} for i, t in enumerate(run_times)], "duration": sum(run_times)}
+
+
+def check_shards(shards, plays):
+    assert shards[0][0] == 0 and shards[-1][1] == plays - 1
+    for (_, last), (first, _) in zip(shards, shards[1:]):
+        assert first == last + 1
+    assert all(last >= first for first, last in shards)
+
+
+def test_plan_shards_splits_by_duration():
+    assert plan_shards(timeline([1] * 8), 4) == [(0, 1), (2, 3), (4, 5), (6, 7)]
+    assert plan_shards(timeline([10, 0.1, 0.1, 0.1, 10]), 3) == [(0, 0), (1, 3), (4, 4)]
+
+
+def test_plan_shards_with_more_jobs_than_plays():
+    assert plan_shards(timeline([1] * 10), 20) == [(i, i) for i in range(10)]
+
+
+def test_plan_shards_with_uneven_rounding():
+    # 0.3 * 3 is just under 0.9 in floating point
+    shards = plan_shards(timeline([0.3] * 10), 10)
+    assert shards == [(i, i) for i in range(10)]
+
+
+@pytest.mark.parametrize("jobs", [1, 2, 3, 5, 8, 12, 13])
+def test_plan_shards_gives_each_job_a_play(jobs):
+    run_times = [0.25, 3, 0.5, 0.5, 0.2, 6, 1, 0.15, 0.15, 0.4, 2, 0.3]
+    shards = plan_shards(timeline(run_times), jobs)
+    assert len(shards) == min(jobs, len(run_times))
+    check_shards(shards, len(run_times))
+
+
+def test_plan_shards_of_one_play():
+    assert plan_shards(timeline([2]), 4) == [(0, 0)]
+
+
+@pytest.mark.parametrize("last", [0, 2])
+def test_shard_scene_stops_after_its_last_play(tmp_path, last):
+    manim = pytest.importorskip("manim")
+
+    class Waits(manim.Scene):
+        def construct(self):
+            self.waited = 0
+            for _ in range(4):
+                self.wait(0.1)
+                self.waited += 1
+
+    with manim.tempconfig({"write_to_movie": False, "disable_caching": True, "media_dir": str(tmp_path),
+                           "verbosity": "WARNING"}):
+        scene = shard_scene(Waits, 0, last)(skip_animations=True)
+        scene.render()
+    assert scene.waited == last + 1
+    assert type(scene).__name__ == "Waits_shard0"
@@ -0,0 +1,59 @@
+from fractions import Fraction
+
+import pytest
+
+np = pytest.importorskip("numpy")
+av = pytest.importorskip("av")
+
+from video import FrameEncoder, retime_holds  # noqa: E402
+
+FPS = 10
+
+
+def write_movie(path, frames):
+    encoder = FrameEncoder(path, 64, 36, FPS)
+    for value in range(frames):
+        encoder.write(np.full((36, 64, 4), value * 20, dtype=np.uint8))
+    encoder.close()
+
+
+def frame_times(path):
+    """Presentation time of every frame, in frames, and the movie's length in frames."""
+    with av.open(str(path)) as movie:
+        stream = movie.streams.video[0]
+        packets = [packet for packet in movie.demux(stream) if packet.dts is not None]
+    to_frames = stream.time_base * FPS
+    starts = sorted(round(packet.pts * to_frames) for packet in packets)
+    end = max(round((packet.pts + packet.duration) * to_frames) for packet in packets)
+    return starts, end
+
+
+def test_retime_holds_pushes_later_frames_back(tmp_path):
+    path = tmp_path / "movie.mp4"
+    write_movie(path, 10)
+    assert frame_times(path) == (list(range(10)), 10)
+
+    retime_holds(path, [(6, 3), (2, 5)])
+    starts, end = frame_times(path)
+    assert starts == [0, 1, 2, 8, 9, 10, 11, 15, 16, 17]
+    assert end == 18
+
+
+def test_retime_holds_without_holds_changes_nothing(tmp_path):
+    path = tmp_path / "movie.mp4"
+    write_movie(path, 5)
+    retime_holds(path, [])
+    assert frame_times(path) == (list(range(5)), 5)
+
+
+def test_frame_encoder_hold_delays_the_next_frame(tmp_path):
+    path = tmp_path / "movie.mp4"
+    encoder = FrameEncoder(path, 64, 36, Fraction(FPS))
+    frame = np.zeros((36, 64, 4), dtype=np.uint8)
+    encoder.write(frame)
+    encoder.hold(4)
+    encoder.write(frame)
+    encoder.close()
+    starts, end = frame_times(path)
+    assert starts == [0, 5]
+    assert end == 6
@@ -0,0 +1,115 @@
+"""Helpers for working with rendered movie files without re-encoding."""
+import bisect
+import os
+from fractions import Fraction
+from itertools import accumulate
+
+import av
+
+
+def concat_videos(paths, output_path):
+    """Join movies that share codec settings by stream-copying their packets.
+
+    Uses ffmpeg's concat demuxer, the same way manim joins its partial movie
+    files, so the result is frame-for-frame what a single render produces.
+    """
+    list_path = f"{output_path}.concat.txt"
+    with open(list_path, "w") as f:
+        for path in paths:
+            escaped = os.path.abspath(path).replace("'", "'\\''")
+            f.write(f"file '{escaped}'\n")
+
+    try:
+        with av.open(list_path, options={"safe": "0"}, format="concat") as source, \
+                av.open(str(output_path), mode="w") as output:
+            in_stream = source.streams.video[0]
+            out_stream = output.add_stream(template=in_stream)
+            for packet in source.demux(in_stream):
+                # demux() ends with flushing packets that carry no data
+                if packet.dts is None:
+                    continue
+                packet.stream = out_stream
+                output.mux(packet)
+    finally:
+        os.remove(list_path)
+
+
+def retime_holds(path, holds):
+    """Stretch single frames of a movie into still holds, in place.
+
+    ``holds`` is a list of (frame index, extra frames). Packets are copied,
+    not re-encoded: the held frame's duration grows and every later frame
+    is pushed back, so the movie plays as if the frame had been encoded
+    ``extra`` more times.
+    """
+    holds = sorted(holds)
+    hold_frames = [frame for frame, _ in holds]
+    pushed = [0, *accumulate(extra for _, extra in holds)]
+    extra_at = dict(holds)
+
+    def delay(frame):
+        # Total extra frames from holds that come before this frame
+        return pushed[bisect.bisect_left(hold_frames, frame)]
+
+    retimed = f"{path}.retime.mp4"
+    with av.open(str(path)) as source, av.open(retimed, mode="w") as output:
+        in_stream = source.streams.video[0]
+        out_stream = output.add_stream(template=in_stream)
+        ticks = int(Fraction(1) / (in_stream.average_rate * in_stream.time_base))
+        for packet in source.demux(in_stream):
+            if packet.dts is None:
+                continue
+            frame = packet.pts // ticks
+            if frame in extra_at:
+                packet.duration = ticks * (1 + extra_at[frame])
+            packet.pts += delay(frame) * ticks
+            packet.dts += delay(packet.dts // ticks) * ticks
+            packet.stream = out_stream
+            output.mux(packet)
+    os.replace(retimed, path)
+
+
+class FrameEncoder:
+    """Encodes RGBA frames straight into an H.264 movie, one frame at a time.
+
+    Uses the same codec settings as manim's own movie writer, so movies from
+    here and from a normal render can be joined or compared directly.
+    ``hold`` keeps the last frame on screen without encoding it again, which
+    makes the movie variable frame rate.
+    """
+
+    def __init__(self, path, width, height, frame_rate, crf=23, format=None, options=None, gop=None):
+        self.path = str(path)
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self.container = av.open(self.path, mode="w", format=format, options=options or {})
+        self.stream = self.container.add_stream("libx264", rate=Fraction(frame_rate).limit_denominator(1001))
+        self.stream.width = width
+        self.stream.height = height
+        self.stream.pix_fmt = "yuv420p"
+        self.stream.options = {"crf": str(crf), **({"g": str(gop)} if gop else {})}
+        self.frames = 0
+        self.last = None
+        self.held = 0
+
+    def write(self, pixels, num_frames=1):
+        frame = av.VideoFrame.from_ndarray(pixels, format="rgba")
+        for _ in range(num_frames):
+            frame.pts = self.frames
+            self.container.mux(self.stream.encode(frame))
+            self.frames += 1
+        self.last = frame
+        self.held = 0
+
+    def hold(self, num_frames):
+        """Show the last frame for ``num_frames`` more frames."""
+        # The next frame's timestamp is pushed back; nothing is encoded now
+        self.frames += num_frames
+        self.held += num_frames
+
+    def close(self):
+        if self.held and self.last is not None:
+            # A frame lasts until the next timestamp, so a trailing hold needs one
+            self.last.pts = self.frames - 1
+            self.container.mux(self.stream.encode(self.last))
+        self.container.mux(self.stream.encode())
+        self.container.close()